@@ -2,59 +2,50 @@ const Crime = require('../models/Crime');
 const { extractTextFromFile } = require('../services/fileParser');
 const fs = require('fs');
 const path = require('path');
-const { spawn } = require('child_process');
+// With NLP_SERVICE_URL set, reports go to a running `nlpService.py http` service over
+// keep-alive HTTP; otherwise to a persistent nlpService.py worker child process.
+// Either way models are loaded only once.
+const nlpWorker = process.env.NLP_SERVICE_URL
+  ? require('../services/nlpClient')
+  : require('../services/nlpWorker');
 
 // 🔧 Function to run Python NLP script
-const runNLP = (textToProcess) => {
-  return new Promise((resolve, reject) => {
-      const pyProcess = spawn('python', ['app/services/nlpService.py', 'process', textToProcess]);
-      
-      let output = '';
-      let errorOutput = '';
-      let hasCriticalError = false;
-
-      pyProcess.stdout.on('data', (data) => {
-          output += data.toString();
-      });
-
-      pyProcess.stderr.on('data', (data) => {
-          const errorData = data.toString();
-          errorOutput += errorData;
-          
-          // Check for critical errors (not just warnings)
-          if (errorData.includes('Error') || 
-              errorData.includes('Traceback') ||
-              errorData.includes('Exception')) {
-              hasCriticalError = true;
-          }
-      });
-
-      pyProcess.on('close', (code) => {
-          // Debug logging
-          console.log('Python Process - Exit code:', code);
-          console.log('Python Process - Output:', output);
-          console.log('Python Process - Error Output:', errorOutput);
-          
-          if (code !== 0 || hasCriticalError) {
-              return reject(new Error(`NLP processing failed: ${errorOutput || 'Unknown error'}`));
-          }
-
-          try {
-              // Handle empty output
-              if (!output.trim()) {
-                  throw new Error('Python process returned empty output');
-              }
-              
-              const result = JSON.parse(output);
-              resolve(result);
-          } catch (err) {
-              reject(new Error(`Failed to parse NLP output: ${err.message}. Raw output: ${output}`));
+const NLP_DEADLINE_MS = Number(process.env.NLP_DEADLINE_MS) || undefined;
+const NLP_TIMINGS = process.env.NLP_TIMINGS === '1';
+const runNLP = (textToProcess, onPartial) =>
+  nlpWorker.process(textToProcess, { deadlineMs: NLP_DEADLINE_MS, timings: NLP_TIMINGS, onPartial });
+const runFormNLP = (fields) => nlpWorker.processForm(fields, { deadlineMs: NLP_DEADLINE_MS, timings: NLP_TIMINGS });
+
+// Clients that accept application/x-ndjson (or pass ?stream=1) get the entities,
+// classification and severity as an {"stage": "analysis", "partial": {...}} line
+// as soon as they are known, followed by the usual response body as the last line
+// (with its HTTP status in "status"). Everyone else gets a single JSON response.
+const wantsStream = (req) =>
+  req.query.stream === '1' || (req.get('Accept') || '').includes('application/x-ndjson');
+
+const streamingResponse = (req, res) => {
+  const streaming = wantsStream(req);
+  return {
+    onPartial: streaming
+      ? (stage, partial) => {
+          if (!res.headersSent) {
+            res.status(200).set('Content-Type', 'application/x-ndjson');
           }
-      });
-  });
+          res.write(JSON.stringify({ stage, partial }) + '\n');
+        }
+      : undefined,
+    send: (status, body) => {
+      if (res.headersSent) {
+        res.end(JSON.stringify({ status, ...body }) + '\n');
+      } else {
+        res.status(status).json(body);
+      }
+    }
+  };
 };
 
 exports.processCrimeReport = async (req, res) => {
+  const reply = streamingResponse(req, res);
   try {
     let { inputMethod, source, crimeText, manualData } = req.body;
     let extractedText = '';
@@ -77,20 +68,40 @@ exports.processCrimeReport = async (req, res) => {
       textToProcess = crimeText;
     } else if (inputMethod === 'upload') {
       textToProcess = extractedText;
-    } else if (inputMethod === 'manual') {
-      // Convert manual data to a text format for NLP
-      textToProcess =
-        `Crime Type: ${manualData.crimeType}\n` +
-        `Victim: ${manualData.victim}\n` +
-        `Suspect: ${manualData.suspect}\n` +
-        `Location: ${manualData.location}\n` +
-        `Date: ${manualData.date}\n` +
-        `Weapon: ${manualData.weapon}\n` +
-        `Description: ${manualData.description}`;
     }
 
-    // Run Python NLP
-    const nlpResults = await runNLP(textToProcess);
+    // Run Python NLP. Manual forms are analyzed field by field, so an edit to one
+    // field only redoes that field's work
+    const nlpResults = inputMethod === 'manual'
+      ? await runFormNLP(manualData || {})
+      : await runNLP(textToProcess, reply.onPartial);
+    if (nlpResults.timings) {
+      console.log('NLP timings:', JSON.stringify(nlpResults.timings));
+    }
+
+    // A rewrite or re-upload of a report we already have: return the existing record.
+    // An identical report comes from the result cache with its own reportKey and no
+    // duplicateOf, so look that key up too.
+    const existingKey = nlpResults.duplicateOf || nlpResults.reportKey;
+    if (existingKey) {
+      const existing = await Crime.findOne({ reportKey: existingKey });
+      if (existing) {
+        if (req.file) {
+          fs.unlink(req.file.path, (err) => {
+            if (err) console.error('Error deleting file:', err);
+          });
+        }
+        return reply.send(200, {
+          success: true,
+          data: existing,
+          duplicate: true,
+          similarity: nlpResults.duplicateOf ? nlpResults.similarity : 1,
+          message: nlpResults.duplicateOf
+            ? 'Near-duplicate of an existing crime report'
+            : 'Identical to an existing crime report'
+        });
+      }
+    }
 
     // Create new crime record
     const newCrime = new Crime({
@@ -107,6 +118,7 @@ exports.processCrimeReport = async (req, res) => {
       confidence: nlpResults.confidence,
       severityScore: nlpResults.severityScore,
       entities: nlpResults.entities,
+      reportKey: nlpResults.reportKey,
 
       // Mapped additional NLP fields
       primary_victim: nlpResults.primary_victim,
@@ -126,14 +138,14 @@ exports.processCrimeReport = async (req, res) => {
       });
     }
 
-    res.status(201).json({
+    reply.send(201, {
       success: true,
       data: newCrime,
       message: 'Crime report processed successfully'
     });
   } catch (error) {
     console.error('Error processing crime report:', error);
-    res.status(500).json({
+    reply.send(500, {
       success: false,
       error: error.message
     });
@@ -45,6 +45,11 @@ const crimeSchema = new mongoose.Schema({
   confidence: Number,  // Add this too
   classification: String,
   severityScore: Number,
+  // Content hash of the analyzed text, used to find the record for near-duplicate reports
+  reportKey: {
+    type: String,
+    index: true
+  },
   createdAt: {
     type: Date,
     default: Date.now
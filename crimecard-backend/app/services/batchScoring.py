@@ -0,0 +1,153 @@
+#crimecard-backend\app\services\batchScoring.py
+"""Classification and severity for many reports at once, with NumPy.
+
+The keyword hits of each chunk of reports become a dense boolean
+report-by-term matrix, and crime scores come from multiplying it by a
+term-by-crime weight matrix built from the keyword tables.
+Extracted weapons are handled the same way through a report-by-weapon count
+matrix over the distinct weapon strings of the batch. Every rule of
+classify_crime and calculate_severity is applied as an array operation, so
+each report gets exactly the result the per-report functions would give.
+"""
+
+
+class BatchScorer:
+    """Weight matrices compiled from the scoring tables of an nlpService module"""
+
+    def __init__(self, service):
+        import numpy as np
+
+        self.service = service
+        self.crimes = list(service.crime_keywords)
+        self.crime_index = crime_index = {crime: c for c, crime in enumerate(self.crimes)}
+
+        terms = []
+        for mentions in service.direct_mentions.values():
+            terms.extend(mentions)
+        for keywords in service.crime_keywords.values():
+            terms.extend(keywords)
+        terms.extend(service.violence_keywords)
+        terms.extend(service.homicide_context_terms)
+        terms.extend(service.definitive_homicide_terms)
+        terms.extend(service.fallback_assault_terms + service.fallback_homicide_terms + service.fallback_fraud_terms)
+        terms.append("found")
+        self.terms = sorted(set(terms))
+        self.term_index = {term: t for t, term in enumerate(self.terms)}
+        missing = set(self.terms) - service.load_keyword_index().vocabulary
+        if missing:
+            raise KeyError(f"Keywords not indexed: {sorted(missing)!r}")
+
+        # Terms repeated within a list count once per repetition, as in the loops
+        self.weights = np.zeros((len(self.terms), len(self.crimes)), dtype=np.int64)
+        for crime, mentions in service.direct_mentions.items():
+            for mention in mentions:
+                self.weights[self.term_index[mention], crime_index[crime]] += 3
+        for crime, keywords in service.crime_keywords.items():
+            for keyword in keywords:
+                self.weights[self.term_index[keyword], crime_index[crime]] += 1
+
+        columns = lambda words: [self.term_index[word] for word in words]
+        self.homicide_context = columns(service.homicide_context_terms)
+        self.definitive_homicide = columns(service.definitive_homicide_terms)
+        self.found = self.term_index["found"]
+        self.fallback_assault = columns(service.fallback_assault_terms)
+        self.fallback_homicide = columns(service.fallback_homicide_terms)
+        self.fallback_fraud = columns(service.fallback_fraud_terms)
+        # Added one at a time in table order, so float boosts round the same way
+        self.violence = [(self.term_index[keyword], boost) for keyword, boost in service.violence_keywords.items()]
+
+        self.homicide = crime_index["homicide"]
+        self.assault = crime_index["assault"]
+        self.fraud = crime_index["fraud"]
+        self.base = np.array([service.base_severity.get(crime, 3) for crime in self.crimes], dtype=np.int64)
+        self.other_base = service.base_severity.get("other", 3)
+
+    def hit_matrix(self, hits_list):
+        """(rows, columns) of every scoring term present in each report"""
+        import numpy as np
+        from itertools import chain
+
+        term_index = self.term_index
+        per_report = [[term_index[keyword] for keyword in hits.offsets if keyword in term_index] for hits in hits_list]
+        lengths = np.fromiter(map(len, per_report), dtype=np.int64, count=len(per_report))
+        rows = np.repeat(np.arange(len(per_report), dtype=np.int64), lengths)
+        columns = np.fromiter(chain.from_iterable(per_report), dtype=np.int64, count=int(lengths.sum()))
+        return rows, columns
+
+    def weapon_matrix(self, entities_list):
+        """Report-by-weapon counts, with the crime and severity boosts of each distinct weapon"""
+        import numpy as np
+
+        weapon_index = {}
+        rows, columns = [], []
+        for row, entities in enumerate(entities_list):
+            weapons = entities.get("weapons")
+            if weapons:
+                for weapon in weapons:
+                    rows.append(row)
+                    columns.append(weapon_index.setdefault(weapon, len(weapon_index)))
+        counts = np.zeros((len(entities_list), len(weapon_index)), dtype=np.int64)
+        np.add.at(counts, (np.array(rows, dtype=np.int64), np.array(columns, dtype=np.int64)), 1)
+
+        crime_boosts = np.zeros((len(weapon_index), len(self.crimes)), dtype=np.int64)
+        for weapon, w in weapon_index.items():
+            for crime, boost in self.service.weapon_crime_scores(weapon).items():
+                crime_boosts[w, self.crime_index[crime]] += boost
+        boosts = [self.service.weapon_severity_boost(weapon) for weapon in weapon_index]
+        # Integer boosts stay integers, so their sum is exact in any order
+        severity_boosts = np.array(boosts) if boosts else np.zeros(0, dtype=np.int64)
+        return counts, crime_boosts, severity_boosts
+
+    def score(self, hits_list, entities_list, chunk_size=65536):
+        """(crime_type, confidence, severity) per report, as classify_crime and calculate_severity return them"""
+        results = []
+        for start in range(0, len(hits_list), chunk_size):
+            results.extend(self._score_chunk(hits_list[start:start + chunk_size],
+                                             entities_list[start:start + chunk_size]))
+        return results
+
+    def _score_chunk(self, hits_list, entities_list):
+        import numpy as np
+
+        n = len(hits_list)
+        rows, columns = self.hit_matrix(hits_list)
+        present = np.zeros((n, len(self.terms)), dtype=bool)
+        present[rows, columns] = True
+        victims = np.array([len(entities["victims"]) for entities in entities_list], dtype=np.int64)
+        weapons, weapon_crimes, weapon_severity = self.weapon_matrix(entities_list)
+
+        # classify_crime
+        scores = present.astype(np.int64) @ self.weights
+        scores[:, self.homicide] += 3 * ((victims > 0) & present[:, self.homicide_context].any(axis=1))
+        scores[:, self.homicide] += 5 * present[:, self.definitive_homicide].any(axis=1)
+        scores[:, self.homicide] += 2 * ((victims > 1) & present[:, self.found])
+        scores += weapons @ weapon_crimes
+
+        unscored = ~scores.any(axis=1)
+        assault = unscored & present[:, self.fallback_assault].any(axis=1)
+        scores[:, self.assault] += assault
+        scores[:, self.homicide] += 2 * (assault & present[:, self.fallback_homicide].any(axis=1))
+        scores[:, self.fraud] += unscored & present[:, self.fallback_fraud].any(axis=1)
+
+        # max() keeps the first of tied crimes, and so does argmax
+        other = ~scores.any(axis=1)
+        predicted = scores.argmax(axis=1)
+        total = scores.sum(axis=1)
+        top = scores[np.arange(n), predicted]
+        confidence = np.minimum(1.0, top / np.where(total > 0, total, 1))
+
+        # calculate_severity
+        severity = np.where(other, self.other_base, self.base[predicted])
+        severity = severity + weapons @ weapon_severity
+        severity = severity + np.where(victims > 1, np.minimum(victims, 3), 0)
+        severity = severity.astype(np.float64)
+        for column, boost in self.violence:
+            severity = severity + np.where(present[:, column], boost, 0.0)
+        severity = np.minimum(10, np.maximum(1, np.round(severity))).astype(np.int64)
+
+        crimes = self.crimes
+        return [
+            ("other", 0.0, score) if unclassified else (crimes[crime], ratio, score)
+            for unclassified, crime, ratio, score in zip(other.tolist(), predicted.tolist(),
+                                                         confidence.tolist(), severity.tolist())
+        ]
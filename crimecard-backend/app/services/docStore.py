@@ -0,0 +1,67 @@
+#crimecard-backend\app\services\docStore.py
+"""Parsed spaCy Docs kept in DocBin form, keyed by report content hash.
+
+A parse depends only on the text and the spaCy pipeline, so a saved Doc stays
+valid across rule, keyword and severity changes and lets those be re-scored
+without running the pipeline again. The summary each report got is stored
+next to its Doc, since it depends on the text alone. Everything is dropped
+when the pipeline version changes.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+class DocStore:
+    """SQLite table of serialized Docs and their summaries"""
+
+    def __init__(self, path, version):
+        self.path = path
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("CREATE TABLE IF NOT EXISTS docs (key TEXT PRIMARY KEY, doc BLOB, summary TEXT, updated REAL)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+
+            row = self._db.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+            if row is None or row[0] != version:
+                # A different pipeline would parse the same text differently
+                self._db.execute("DELETE FROM docs")
+                self._db.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (version,))
+
+    def put(self, key, doc, summary):
+        """Save a report's Doc with its summary record"""
+        from spacy.tokens import DocBin
+
+        data = DocBin(store_user_data=False, docs=[doc]).to_bytes()
+        with self._lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO docs VALUES (?, ?, ?, ?)",
+                             (key, data, json.dumps(summary), time.time()))
+
+    def get(self, key, vocab):
+        """(doc, summary) for key, or None when it was never saved"""
+        from spacy.tokens import DocBin
+
+        with self._lock:
+            row = self._db.execute("SELECT doc, summary FROM docs WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        doc = next(DocBin().from_bytes(row[0]).get_docs(vocab))
+        return doc, json.loads(row[1])
+
+    def keys(self):
+        with self._lock:
+            return [key for (key,) in self._db.execute("SELECT key FROM docs ORDER BY key")]
+
+    def stats(self):
+        with self._lock:
+            docs, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(doc)), 0) FROM docs").fetchone()
+        return {"docs": docs, "bytes": size}
+
+    def clear(self):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM docs")
@@ -10,6 +10,11 @@ exports.extractTextFromFile = async (filePath) => {
     if (ext === '.txt') {
       return fs.promises.readFile(filePath, 'utf8');
     } else if (ext === '.pdf' || ext === '.docx') {
+      if (process.env.NLP_SERVICE_URL) {
+        // A running `nlpService.py http` service extracts without starting Python
+        return await require('./nlpClient').extract(filePath);
+      }
+
       // Use Python script to extract text
       const options = {
         mode: 'text',
@@ -19,8 +24,15 @@ exports.extractTextFromFile = async (filePath) => {
         args: ['extract', filePath]
       };
 
-      const results = await PythonShell.run('nlpService.py', options);
-      return results.join('\n');
+      // The whole text is needed before analysis, so the printed pages are collected and
+      // joined once the script exits. PDF_MAX_PAGES / PDF_MAX_BYTES / PDF_WORKERS in the
+      // environment limit large uploads.
+      return await new Promise((resolve, reject) => {
+        const lines = [];
+        const shell = new PythonShell('nlpService.py', options);
+        shell.on('message', (line) => lines.push(line));
+        shell.end((err) => (err ? reject(err) : resolve(lines.join('\n'))));
+      });
     } else {
       throw new Error('Unsupported file format');
     }
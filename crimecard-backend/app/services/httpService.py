@@ -0,0 +1,380 @@
+#crimecard-backend\app\services\httpService.py
+"""Local HTTP front end for the NLP service.
+
+A small asyncio HTTP/1.1 server (keep-alive, JSON bodies with Content-Length)
+in front of the same process/extract functions the stdin worker uses:
+
+    POST /process  {"text": ..., "deadline_ms": ..., "timings": ...}
+    POST /process-form  {"fields": {"crimeType": ..., "victim": ..., ...}, "deadline_ms": ...}
+    POST /extract  {"path": ...}
+    POST /batch    {"texts": [...]} or {"paths": [...]}
+    GET  /health   liveness; always 200 while the process is up
+    GET  /ready    200 once models are loaded, 503 while loading or draining
+    GET  /stats    admission, batching, worker memory and cache counters
+
+CPU-bound work never runs on the event loop. With one worker, reports go
+through a MicroBatcher thread; with more, through a ForkServerPool whose
+workers share spaCy and the rules copy-on-write, load T5 themselves, and are
+recycled after a number of requests or past an RSS limit. At most max_pending reports are admitted at a
+time; past that, requests get 429 with Retry-After. On SIGTERM or SIGINT the
+server stops accepting connections, answers new requests with 503, finishes
+the admitted ones and exits.
+"""
+import asyncio
+import json
+import signal
+import sys
+import threading
+import time
+
+STATUS_TEXT = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 411: "Length Required",
+    413: "Payload Too Large", 429: "Too Many Requests", 500: "Internal Server Error", 503: "Service Unavailable"
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+class NLPHTTPServer:
+    """Routes HTTP requests to an nlpService module under admission control"""
+
+    def __init__(self, service, workers=1, max_pending=64, batch_size=8, batch_window_ms=20,
+                 max_request_bytes=16 * 1024 * 1024, drain_seconds=30, max_requests_per_worker=0,
+                 max_worker_rss_mb=0):
+        self.service = service
+        self.workers = max(1, int(workers))
+        self.max_requests_per_worker = max_requests_per_worker
+        self.max_worker_rss_mb = max_worker_rss_mb
+        self.max_pending = max(1, int(max_pending))
+        self.batch_size = batch_size
+        self.batch_window_ms = batch_window_ms
+        self.max_request_bytes = max_request_bytes
+        self.drain_seconds = drain_seconds
+
+        self.pending = 0
+        self.draining = False
+        self.load_error = None
+        self.models_ready = threading.Event()
+        self.batcher = None
+        self.pool = None
+        self.connections = set()
+        self.counters = {"requests": 0, "rejected": 0, "errors": 0}
+
+    # Model loading and executors
+
+    def load(self):
+        """Load models; forked pool workers share spaCy and the rules copy-on-write.
+
+        TensorFlow starts thread pools that do not survive fork, so with a
+        pool T5 is left out of this process and loaded by each worker.
+        """
+        import gc
+        from batchScheduler import MicroBatcher
+        from workerPool import ForkServerPool
+
+        try:
+            if self.workers > 1:
+                self.service.load_spacy()
+                self.service.load_rule_engine()
+            else:
+                self.service.load_models()
+            self.service.load_keyword_index()
+        except Exception as e:
+            self.load_error = str(e)
+            print(f"Model loading failed: {str(e)}", file=sys.stderr)
+            return
+
+        if self.workers > 1:
+            gc.freeze()
+            self.pool = ForkServerPool(self.service, self.workers, max_requests=self.max_requests_per_worker,
+                                       max_rss_mb=self.max_worker_rss_mb, initializer="load_summarizer")
+        else:
+            self.batcher = MicroBatcher(self.service.process_requests, max_batch_size=self.batch_size,
+                                        window_ms=self.batch_window_ms)
+        self.models_ready.set()
+
+    def model_state(self):
+        service = self.service
+        return {
+            "spacy": service.nlp is not None,
+            # With a pool, each worker loads T5 itself
+            "summarizer": "workers" if self.pool is not None else service.model is not None,
+            "rules": service.rule_engine is not None,
+            "error": self.load_error
+        }
+
+    def run_process(self, loop, text, deadline, timings, dedup=True):
+        """Future for one report, from the batcher thread or a pool worker"""
+        future = loop.create_future()
+
+        def settle(result, error):
+            if future.done():
+                return
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+        if self.pool is not None:
+            self.pool.apply_async(
+                self.service.process_text, (text, deadline, timings, None, dedup),
+                callback=lambda result: loop.call_soon_threadsafe(settle, result, None),
+                error_callback=lambda error: loop.call_soon_threadsafe(settle, None, error)
+            )
+        else:
+            self.batcher.submit((text, deadline, timings, None, dedup),
+                                lambda result, error: loop.call_soon_threadsafe(settle, result, error))
+        return future
+
+    async def process_file(self, loop, path, deadline, timings):
+        """Outcome for one file, as process_files reports it: only extraction runs off the batcher"""
+        try:
+            text = await self.run_blocking(loop, self.service.extract_text, path)
+        except Exception as e:
+            return {"file": path, "ok": False, "error": f"Error: {str(e)}"}
+        try:
+            return {"file": path, "ok": True, "result": await self.run_process(loop, text, deadline, timings)}
+        except Exception as e:
+            return {"file": path, "ok": False, "error": f"Processing error: {str(e)}"}
+
+    def run_blocking(self, loop, func, *args):
+        if self.pool is not None:
+            future = loop.create_future()
+            self.pool.apply_async(
+                func, args,
+                callback=lambda result: loop.call_soon_threadsafe(
+                    lambda: future.done() or future.set_result(result)),
+                error_callback=lambda error: loop.call_soon_threadsafe(
+                    lambda: future.done() or future.set_exception(error))
+            )
+            return future
+        return loop.run_in_executor(None, func, *args)
+
+    # Admission control
+
+    def admit(self, count):
+        if self.draining:
+            raise HTTPError(503, "Server is draining")
+        if not self.models_ready.is_set():
+            raise HTTPError(503, self.load_error or "Models are still loading", {"Retry-After": "5"})
+        if self.pending + count > self.max_pending:
+            self.counters["rejected"] += 1
+            raise HTTPError(429, f"Queue full ({self.pending} reports pending)", {"Retry-After": "1"})
+        self.pending += count
+
+    # Routes
+
+    async def route(self, method, path, body):
+        loop = asyncio.get_running_loop()
+        path = path.split("?", 1)[0]
+
+        if path == "/health":
+            return 200, {"status": "ok"}
+        if path == "/ready":
+            ready = self.models_ready.is_set() and not self.draining
+            status = "ready" if ready else ("draining" if self.draining else "loading")
+            return (200 if ready else 503), {"status": status, "models": self.model_state()}
+        if path == "/stats":
+            cache = self.service.load_result_cache()
+            duplicates = self.service.load_duplicate_index()
+            return 200, {
+                "pending": self.pending,
+                "max_pending": self.max_pending,
+                "workers": self.workers,
+                "draining": self.draining,
+                "counters": self.counters,
+                "batching": self.batcher.stats() if self.batcher else None,
+                "pool": self.pool.stats() if self.pool else None,
+                "cache": cache.stats() if cache else None,
+                "duplicates": duplicates.stats() if duplicates else None
+            }
+
+        if path not in ("/process", "/process-form", "/extract", "/batch"):
+            raise HTTPError(404, f"No route for {path}")
+        if method != "POST":
+            raise HTTPError(405, f"{path} expects POST")
+        try:
+            request = json.loads(body or b"{}")
+        except ValueError as e:
+            raise HTTPError(400, f"Invalid JSON: {str(e)}")
+        if not isinstance(request, dict):
+            raise HTTPError(400, "Request body must be a JSON object")
+
+        if path == "/process":
+            text = request.get("text")
+            if not isinstance(text, str):
+                raise HTTPError(400, "Missing text")
+            self.admit(1)
+            try:
+                return 200, await self.run_process(loop, text, self.service.request_deadline(request),
+                                                   bool(request.get("timings")))
+            finally:
+                self.pending -= 1
+
+        if path == "/process-form":
+            fields = request.get("fields")
+            if not isinstance(fields, dict):
+                raise HTTPError(400, "Missing fields")
+            description = self.service.form_fields(fields)["description"]
+            self.admit(1)
+            try:
+                result = None
+                if description:
+                    result = await self.run_process(loop, description, self.service.request_deadline(request),
+                                                    bool(request.get("timings")), dedup=False)
+                # Only the short structured fields are scanned here, so this stays on the event loop
+                return 200, self.service.assemble_form(fields, result, bool(request.get("timings")))
+            finally:
+                self.pending -= 1
+
+        if path == "/extract":
+            if not isinstance(request.get("path"), str):
+                raise HTTPError(400, "Missing path")
+            self.admit(1)
+            try:
+                return 200, {"text": await self.run_blocking(loop, self.service.extract_text, request["path"])}
+            finally:
+                self.pending -= 1
+
+        texts, paths = request.get("texts"), request.get("paths")
+        if isinstance(texts, list) and all(isinstance(text, str) for text in texts):
+            self.admit(len(texts))
+            try:
+                deadline = self.service.request_deadline(request)
+                results = await asyncio.gather(*[
+                    self.run_process(loop, text, deadline, bool(request.get("timings"))) for text in texts
+                ], return_exceptions=True)
+            finally:
+                self.pending -= len(texts)
+            return 200, {"results": [
+                {"ok": False, "error": str(result)} if isinstance(result, Exception) else {"ok": True, "result": result}
+                for result in results
+            ]}
+        if isinstance(paths, list) and all(isinstance(path, str) for path in paths):
+            self.admit(len(paths))
+            try:
+                deadline = self.service.request_deadline(request)
+                return 200, {"results": await asyncio.gather(*[
+                    self.process_file(loop, path, deadline, bool(request.get("timings"))) for path in paths
+                ])}
+            finally:
+                self.pending -= len(paths)
+        raise HTTPError(400, "Expected texts or paths")
+
+    # HTTP/1.1 connection handling
+
+    async def handle_connection(self, reader, writer):
+        self.connections.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self.respond(writer, 400, {"error": "Malformed request line"}, keep_alive=False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                try:
+                    if "chunked" in headers.get("transfer-encoding", "").lower():
+                        keep_alive = False
+                        raise HTTPError(411, "Chunked bodies are not supported; send Content-Length")
+                    length = int(headers.get("content-length", 0) or 0)
+                    if length > self.max_request_bytes:
+                        keep_alive = False
+                        raise HTTPError(413, f"Request exceeds {self.max_request_bytes} bytes")
+                    body = await reader.readexactly(length) if length else b""
+                    self.counters["requests"] += 1
+                    status, payload = await self.route(method.upper(), path, body)
+                    extra = {}
+                except HTTPError as e:
+                    status, payload, extra = e.status, {"error": str(e)}, e.headers
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except Exception as e:
+                    self.counters["errors"] += 1
+                    status, payload, extra = 500, {"error": f"Processing error: {str(e)}"}, {}
+
+                keep_alive = keep_alive and not self.draining
+                await self.respond(writer, status, payload, keep_alive, extra)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self.connections.discard(writer)
+            writer.close()
+
+    async def respond(self, writer, status, payload, keep_alive=True, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        lines = [
+            f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}"
+        ]
+        lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+    # Lifecycle
+
+    async def serve(self, host, port):
+        loop = asyncio.get_running_loop()
+        stopped = loop.create_future()
+
+        def drain():
+            if not self.draining:
+                self.draining = True
+                print("Draining: finishing admitted requests", file=sys.stderr)
+                loop.create_task(self.shutdown(server, stopped))
+
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, drain)
+
+        if self.workers > 1:
+            # Fork the pool before the event loop starts any threads
+            self.load()
+        else:
+            threading.Thread(target=self.load, daemon=True).start()
+
+        server = await asyncio.start_server(self.handle_connection, host, port, limit=64 * 1024)
+        print(f"NLP HTTP service listening on http://{host}:{port}", file=sys.stderr)
+        await stopped
+
+    async def shutdown(self, server, stopped):
+        server.close()
+        deadline = time.monotonic() + self.drain_seconds
+        while self.pending and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        # Idle keep-alive connections would otherwise hold the server open
+        for writer in list(self.connections):
+            writer.close()
+        if self.batcher is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.batcher.close)
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+        stopped.set_result(None)
+
+
+def run_server(service, host="127.0.0.1", port=8765, **options):
+    """Serve service (the nlpService module) over HTTP until SIGTERM/SIGINT"""
+    asyncio.run(NLPHTTPServer(service, **options).serve(host, port))
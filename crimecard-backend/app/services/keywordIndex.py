@@ -0,0 +1,161 @@
+#crimecard-backend\app\services\keywordIndex.py
+"""Aho-Corasick keyword automaton.
+
+Finds every occurrence of every keyword in a single pass over the text, so
+scoring cost grows with the text length rather than text length times
+vocabulary size. Matching is plain substring matching, the same as
+`keyword in text`.
+"""
+from bisect import bisect_left, bisect_right
+from collections import deque
+
+
+class KeywordHits:
+    """Occurrences of each keyword found in one scan"""
+
+    def __init__(self, offsets, vocabulary):
+        self.offsets = offsets  # keyword -> list of start offsets
+        self.vocabulary = vocabulary
+
+    def __contains__(self, keyword):
+        if keyword not in self.vocabulary:
+            # A keyword missing from the automaton would otherwise silently never match
+            raise KeyError(f"Keyword not indexed: {keyword!r}")
+        return keyword in self.offsets
+
+    def count(self, keyword):
+        return len(self.offsets.get(keyword, ()))
+
+    def first(self, keyword):
+        """Start offset of the first occurrence, or -1 like str.find"""
+        positions = self.offsets.get(keyword)
+        return positions[0] if positions else -1
+
+    def any(self, keywords):
+        return any(keyword in self for keyword in keywords)
+
+    def between(self, start, end):
+        """Hits that lie entirely inside text[start:end], with offsets relative to start"""
+        offsets = {}
+        for keyword, positions in self.offsets.items():
+            # Positions are sorted, so the hits inside are one contiguous slice
+            lo = bisect_left(positions, start)
+            hi = bisect_right(positions, end - len(keyword), lo)
+            if lo < hi:
+                offsets[keyword] = [pos - start for pos in positions[lo:hi]]
+        return KeywordHits(offsets, self.vocabulary)
+
+    @property
+    def counts(self):
+        return {keyword: len(positions) for keyword, positions in self.offsets.items()}
+
+
+class KeywordAutomaton:
+    """Compiled multi-pattern matcher over a fixed keyword vocabulary"""
+
+    def __init__(self, keywords):
+        self.keywords = sorted(set(k for k in keywords if k))
+        self.vocabulary = frozenset(self.keywords)
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+
+        for keyword in self.keywords:
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                state = next_state
+            self._output[state] = self._output[state] + (keyword,)
+
+        # Breadth-first pass to fill in failure links and inherited outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def search(self, text):
+        """Scan text once and return a KeywordHits for every keyword found"""
+        goto, fail, output = self._goto, self._fail, self._output
+        offsets = {}
+        state = 0
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword in output[state]:
+                offsets.setdefault(keyword, []).append(i - len(keyword) + 1)
+        return KeywordHits(offsets, self.vocabulary)
+
+
+class MentionIndex:
+    """Character offsets of every name and keyword mention in one document.
+
+    Built once per report so that proximity checks are offset lookups instead
+    of repeated `text.find` calls, and see every occurrence rather than only
+    the first.
+    """
+
+    def __init__(self, lowered, keyword_hits, names=()):
+        self.lowered = lowered
+        self.keyword_hits = keyword_hits
+        names = sorted(set(name.lower() for name in names if name))
+        if names:
+            self.name_hits = KeywordAutomaton(names).search(lowered)
+        else:
+            self.name_hits = KeywordHits({}, frozenset())
+
+    def chars(self, term):
+        """Start offsets of every occurrence of a name or indexed keyword"""
+        term = term.lower()
+        if term in self.name_hits.vocabulary:
+            return self.name_hits.offsets.get(term, [])
+        if term not in self.keyword_hits.vocabulary:
+            raise KeyError(f"Term not indexed: {term!r}")
+        return self.keyword_hits.offsets.get(term, [])
+
+    def first(self, term):
+        positions = self.chars(term)
+        return positions[0] if positions else -1
+
+    def in_window(self, terms, start, end):
+        """True if any of terms occurs entirely inside [start, end)"""
+        for term in terms:
+            length = len(term)
+            for pos in self.chars(term):
+                if pos >= end:
+                    break
+                if pos >= start and pos + length <= end:
+                    return True
+        return False
+
+    def near(self, term, position, distance):
+        """True if any occurrence of term starts less than distance characters from position"""
+        positions = self.chars(term)
+        i = bisect_left(positions, position - distance + 1)
+        return i < len(positions) and positions[i] < position + distance
+
+    def close_pairs(self, names, distance):
+        """Pairs of names with occurrences starting less than distance characters apart.
+
+        Yields (name_a, name_b, start_a, start_b) with start_a <= start_b, using a
+        single sweep over the sorted occurrences instead of comparing every pair.
+        """
+        occurrences = sorted((pos, i) for i, name in enumerate(names) for pos in self.chars(name))
+        for k, (pos_a, i) in enumerate(occurrences):
+            for pos_b, j in occurrences[k + 1:]:
+                if pos_b - pos_a >= distance:
+                    break
+                if i != j:
+                    yield names[i], names[j], pos_a, pos_b
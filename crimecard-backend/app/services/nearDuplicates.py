@@ -0,0 +1,139 @@
+#crimecard-backend\app\services\nearDuplicates.py
+"""MinHash/LSH index of analyzed reports, for spotting near-duplicate text.
+
+Each report is reduced to a MinHash signature over its word shingles. The
+signature is split into bands, and every band is hashed into a bucket table,
+so a lookup reads only the reports that share a bucket with the query rather
+than scanning the whole index. Candidates are then verified by estimated
+Jaccard similarity. Signatures, buckets and the stored analyses live in one
+SQLite file, updated incrementally and dropped when the fingerprint changes.
+"""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_WORD = re.compile(r"\w+")
+
+
+class NearDuplicateIndex:
+    """Persistent MinHash/LSH index mapping report keys to stored results"""
+
+    def __init__(self, path, fingerprint, num_perm=128, bands=16, shingle_size=5, threshold=0.9,
+                 min_words=20, max_candidates=64, seed=1):
+        import numpy as np
+
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.path = path
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.min_words = min_words
+        self.max_candidates = max_candidates
+        generator = np.random.RandomState(seed)
+        self._a = generator.randint(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = generator.randint(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("CREATE TABLE IF NOT EXISTS docs (key TEXT PRIMARY KEY, signature BLOB, value TEXT)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS buckets (band INTEGER, hash INTEGER, key TEXT)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS buckets_lookup ON buckets (band, hash)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+
+            # Signatures are only comparable under the same hashing parameters
+            version = json.dumps([fingerprint, num_perm, bands, shingle_size, seed])
+            row = self._db.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+            if row is None or row[0] != version:
+                self._db.execute("DELETE FROM docs")
+                self._db.execute("DELETE FROM buckets")
+                self._db.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (version,))
+
+    def signature(self, text):
+        """MinHash signature of text's word shingles, or None if text is too short to compare"""
+        import numpy as np
+
+        words = _WORD.findall(text.lower())
+        if len(words) < self.min_words:
+            return None
+        size = self.shingle_size
+        shingles = {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+        hashes = np.array(
+            [int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little") for s in shingles],
+            dtype=np.uint64
+        )
+        signature = np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        # (a * h + b) mod p per permutation, in slices to bound memory on long documents;
+        # wrap-around in uint64 is part of the scheme
+        with np.errstate(over="ignore"):
+            for start in range(0, len(hashes), 4096):
+                permuted = (np.outer(hashes[start:start + 4096], self._a) + self._b) % np.uint64(_MERSENNE_PRIME)
+                np.minimum(signature, (permuted & np.uint64(_MAX_HASH)).min(axis=0), out=signature)
+        return signature.astype(np.uint32)
+
+    def _band_hashes(self, signature):
+        rows = self.rows
+        for band in range(self.bands):
+            digest = hashlib.blake2b(signature[band * rows:(band + 1) * rows].tobytes(), digest_size=8).digest()
+            yield band, int.from_bytes(digest, "little", signed=True)
+
+    def query(self, signature):
+        """(key, similarity, value) of the most similar indexed report above threshold, or None"""
+        import numpy as np
+
+        if signature is None:
+            return None
+        with self._lock:
+            candidates = []
+            for band, bucket in self._band_hashes(signature):
+                for (key,) in self._db.execute(
+                    "SELECT key FROM buckets WHERE band = ? AND hash = ? LIMIT ?", (band, bucket, self.max_candidates)
+                ):
+                    if key not in candidates:
+                        candidates.append(key)
+                if len(candidates) >= self.max_candidates:
+                    break
+
+            best = None
+            for key in candidates:
+                row = self._db.execute("SELECT signature, value FROM docs WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    continue
+                similarity = float(np.mean(np.frombuffer(row[0], dtype=np.uint32) == signature))
+                if similarity >= self.threshold and (best is None or similarity > best[1]):
+                    best = (key, similarity, row[1])
+        if best is None:
+            return None
+        return best[0], best[1], json.loads(best[2])
+
+    def add(self, key, signature, value):
+        """Index a report's signature with the result to reuse for its near-duplicates"""
+        if signature is None:
+            return
+        with self._lock, self._db:
+            exists = self._db.execute("SELECT 1 FROM docs WHERE key = ?", (key,)).fetchone()
+            self._db.execute("INSERT OR REPLACE INTO docs VALUES (?, ?, ?)", (key, signature.tobytes(), json.dumps(value)))
+            if not exists:
+                self._db.executemany(
+                    "INSERT INTO buckets VALUES (?, ?, ?)",
+                    [(band, bucket, key) for band, bucket in self._band_hashes(signature)]
+                )
+
+    def stats(self):
+        with self._lock:
+            reports = self._db.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+        return {"reports": reports, "threshold": self.threshold, "num_perm": self.num_perm, "bands": self.bands}
+
+    def clear(self):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM docs")
+            self._db.execute("DELETE FROM buckets")
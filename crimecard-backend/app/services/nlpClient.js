@@ -0,0 +1,83 @@
+//crimecard-backend\app\services\nlpClient.js
+const http = require('http');
+
+const NLP_SERVICE_URL = process.env.NLP_SERVICE_URL || 'http://127.0.0.1:8765';
+const RETRIES = Number(process.env.NLP_HTTP_RETRIES) || 2;
+
+// Client for `nlpService.py http`. Connections are kept alive and reused, so
+// a request costs one round trip to an already warm service.
+const agent = new http.Agent({
+  keepAlive: true,
+  maxSockets: Number(process.env.NLP_HTTP_SOCKETS) || 16
+});
+
+const post = (pathname, body) => new Promise((resolve, reject) => {
+  const data = JSON.stringify(body);
+  const req = http.request(new URL(pathname, NLP_SERVICE_URL), {
+    method: 'POST',
+    agent,
+    headers: {
+      'Content-Type': 'application/json',
+      'Content-Length': Buffer.byteLength(data)
+    }
+  }, (res) => {
+    const chunks = [];
+    res.on('data', (chunk) => chunks.push(chunk));
+    res.on('end', () => {
+      let payload;
+      try {
+        payload = JSON.parse(Buffer.concat(chunks).toString('utf8'));
+      } catch (err) {
+        reject(new Error(`NLP processing failed: unparseable response (${res.statusCode})`));
+        return;
+      }
+      if (res.statusCode === 200) {
+        resolve(payload);
+        return;
+      }
+      const error = new Error(`NLP processing failed: ${payload.error || res.statusCode}`);
+      error.status = res.statusCode;
+      error.retryAfter = Number(res.headers['retry-after']) || 1;
+      reject(error);
+    });
+  });
+  req.on('error', (err) => reject(new Error(`NLP processing failed: ${err.message}`)));
+  req.end(data);
+});
+
+// 429 (queue full) and 503 (loading or draining) are worth a short wait and another try
+const postWithRetry = async (pathname, body) => {
+  for (let attempt = 0; ; attempt++) {
+    try {
+      return await post(pathname, body);
+    } catch (err) {
+      if (attempt >= RETRIES || (err.status !== 429 && err.status !== 503)) throw err;
+      await new Promise((resolve) => setTimeout(resolve, err.retryAfter * 1000));
+    }
+  }
+};
+
+// Same interface as nlpWorker
+exports.process = (text, options = {}) => {
+  const body = { text };
+  if (options.deadlineMs) {
+    body.deadline_ms = options.deadlineMs;
+  }
+  if (options.timings) {
+    body.timings = true;
+  }
+  return postWithRetry('/process', body);
+};
+
+exports.processForm = (fields, options = {}) => {
+  const body = { fields };
+  if (options.deadlineMs) {
+    body.deadline_ms = options.deadlineMs;
+  }
+  if (options.timings) {
+    body.timings = true;
+  }
+  return postWithRetry('/process-form', body);
+};
+
+exports.extract = (filePath) => postWithRetry('/extract', { path: filePath }).then((result) => result.text);
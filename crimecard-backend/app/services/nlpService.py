@@ -1,29 +1,94 @@
 #crimecard-backend\app\services\nlpService.py
 import sys
 import json
-import pdfplumber
-import docx
-import tensorflow as tf
-from transformers import TFT5ForConditionalGeneration, T5Tokenizer
-import spacy
-from spacy.matcher import PhraseMatcher, Matcher
 import os
 import re
+import threading
 import warnings
 warnings.filterwarnings("ignore", category=FutureWarning)
 
+from stageTimer import NULL_TIMER
+
 # Force CPU usage to avoid GPU-related issues
 os.environ["CUDA_VISIBLE_DEVICES"] = "-1"
 
-# Load models
-try:
-    # Load spaCy for entity extraction
-    nlp = spacy.load("en_core_web_lg")
-    tokenizer = T5Tokenizer.from_pretrained("t5-small")
-    model = TFT5ForConditionalGeneration.from_pretrained("t5-small")
-except Exception as e:
-    print(f"Model loading failed: {str(e)}", file=sys.stderr)
-    sys.exit(1)
+# Models are loaded lazily so that commands like `extract` never pay for
+# importing spaCy, TensorFlow or transformers
+nlp = None
+tokenizer = None
+model = None
+
+# spaCy pipeline profiles: model size, and the parser swapped for the cheaper
+# sentence recognizer where sentence boundaries are all it is used for. The
+# analysis reads entities, sentences, POS tags (Matcher patterns) and lemmas;
+# it never reads word vectors.
+SPACY_PROFILES = {
+    "fast": {"model": "en_core_web_sm", "exclude": ["parser"], "enable": ["senter"]},
+    "balanced": {"model": "en_core_web_md", "exclude": [], "enable": []},
+    "accurate": {"model": "en_core_web_lg", "exclude": [], "enable": []}
+}
+SPACY_COMPONENTS = {"tok2vec", "tagger", "attribute_ruler", "lemmatizer", "ner", "parser", "senter"}
+SPACY_PROFILE = os.environ.get("CRIMECARD_SPACY_PROFILE", "accurate")
+
+def spacy_profile():
+    """Settings of the selected spaCy profile"""
+    if SPACY_PROFILE not in SPACY_PROFILES:
+        raise RuntimeError(f"Unknown spaCy profile: {SPACY_PROFILE} (expected one of {', '.join(SPACY_PROFILES)})")
+    return SPACY_PROFILES[SPACY_PROFILE]
+
+def load_spacy():
+    """Load the spaCy pipeline of the selected profile on first use"""
+    global nlp
+    if nlp is None:
+        profile = spacy_profile()
+        try:
+            import spacy
+            nlp = spacy.load(profile["model"], exclude=profile["exclude"])
+            for name in profile["enable"]:
+                nlp.enable_pipe(name)
+            # Leave out any other component the model ships with
+            for name in nlp.pipe_names:
+                if name not in SPACY_COMPONENTS:
+                    nlp.disable_pipe(name)
+        except Exception as e:
+            raise RuntimeError(f"Model loading failed: {str(e)}")
+    return nlp
+
+# T5 inference engine: tf (eager reference), tf-xla, onnx or onnx-int8; see summarizerBackends.py
+SUMMARIZER_BACKEND = os.environ.get("CRIMECARD_SUMMARIZER", "tf")
+
+def load_summarizer():
+    """Load the T5 tokenizer and the configured summarizer backend on first use"""
+    global tokenizer, model
+    if model is None:
+        try:
+            from summarizerBackends import load_backend
+            model = load_backend(SUMMARIZER_BACKEND, "t5-small", os.path.join(CACHE_DIR, "summarizers"))
+            tokenizer = model.tokenizer
+        except Exception as e:
+            raise RuntimeError(f"Model loading failed: {str(e)}")
+    return tokenizer, model
+
+# Number of full pipeline runs, so callers can check that a report is parsed once
+pipeline_calls = 0
+
+def parse(text):
+    """Run the spaCy pipeline over text; every stage should share the resulting Doc"""
+    global pipeline_calls
+    pipeline_calls += 1
+    return load_spacy()(text)
+
+def parse_many(texts, batch_size=32):
+    """Run the spaCy pipeline over several texts in batches with nlp.pipe"""
+    global pipeline_calls
+    pipeline_calls += len(texts)
+    return list(load_spacy().pipe(texts, batch_size=batch_size))
+
+def load_models():
+    """Load every model needed by `process`"""
+    load_spacy()
+    load_rule_engine()
+    load_summarizer()
 
 # Crime type keywords with expanded vocabulary
 crime_keywords = {
@@ -52,20 +117,361 @@ authority_patterns = [
     "investigator", "sheriff", "deputy", "chief", "captain"
 ]
 
-def extract_text_from_pdf(pdf_path):
-    """Extract text from PDF files"""
+# Explicit mentions of crime types
+direct_mentions = {
+    "homicide": ["murder", "homicide", "killing", "killed", "murdered", "double homicide", "double murder"],
+    "theft": ["theft", "robbery", "burglary", "stolen", "robbed"],
+    "assault": ["assault", "attack", "battery", "beaten", "assaulted"],
+    "fraud": ["fraud", "scam", "cheated", "swindled"],
+    "drug": ["drug", "narcotics", "cocaine", "heroin", "marijuana"],
+    "acid_attack": ["acid attack", "acid throwing", "chemical attack"],
+    "kidnapping": ["kidnapping", "abduction", "kidnapped", "abducted"]
+}
+
+# Base severity by crime type
+base_severity = {
+    "homicide": 9,
+    "assault": 6,
+    "theft": 4,
+    "fraud": 3,
+    "drug": 5,
+    "acid_attack": 8,
+    "kidnapping": 8,
+    "sexual_assault": 8,
+    "other": 3
+}
+
+# Severity boost by weapon type
+weapon_severity = {
+    "gun": 3,
+    "firearm": 3,
+    "pistol": 3,
+    "rifle": 3,
+    "knife": 2,
+    "acid": 3,
+    "bomb": 4,
+    "explosive": 4
+}
+
+# Particularly violent keywords and their severity boost
+violence_keywords = {
+    "brutally": 1.5,
+    "horrific": 1.5,
+    "gruesome": 1.5,
+    "multiple stab": 2,
+    "pool of blood": 1,
+    "critical condition": 1.5,
+    "severe injuries": 1
+}
+
+# Context-based role analysis keywords
+victim_keywords = ["victim", "victims", "killed", "murdered", "attacked", "assaulted", "injured", "dead", "deceased", "found dead"]
+suspect_keywords = ["suspect", "suspects", "accused", "perpetrator", "attacker", "arrested", "detained", "questioned"]
+officer_keywords = ["police", "officer", "investigator", "detective", "ACP", "DCP", "SI", "PI", "said", "stated", "according to", "leading"]
+family_terms = ["husband", "wife", "daughter", "son", "mother", "father", "sister", "brother", "spouse"]
+
+# Other terms checked by the sentence, weapon and classification heuristics
+homicide_context_terms = ["kill", "killed", "murder", "murdered", "dead", "deceased"]
+definitive_homicide_terms = ["brutally murdered", "found dead", "found murdered"]
+murder_terms = ["killed", "murdered", "dead", "deceased", "stabbed"]
+weapon_context_terms = ["attacked with", "used", "wielding", "armed with"]
+# Weak cues, only consulted when nothing else points to a crime type
+fallback_assault_terms = ["stab", "knife"]
+fallback_homicide_terms = ["dead", "death"]
+fallback_fraud_terms = ["money", "financial"]
+context_keywords = [
+    "found", "found by", "discovered by", "daughter", "said", "stated", "according to",
+    "lead", "leading", "heads", "investigation", "probe", "case",
+    "detained", "questioned", "arrested", "stab", "kitchen knife", "knife",
+    "death", "money", "financial"
+]
+
+# More comprehensive role-detection patterns
+victim_patterns = [
+    # Direct victim mentions
+    [{"LOWER": {"IN": ["victim", "victims"]}}, {"IS_PUNCT": True, "OP": "?"}, {"OP": "*", "POS": {"NOT_IN": ["VERB", "PUNCT"]}}, {"ENT_TYPE": "PERSON"}],
+    # Victims as objects of violence
+    [{"ENT_TYPE": "PERSON"}, {"OP": "*", "POS": {"NOT_IN": ["VERB"]}}, {"LEMMA": {"IN": ["found", "discover", "attack", "murder", "kill"]}}, {"POS": "ADP", "OP": "?"}],
+    # Found or discovered as victims
+    [{"LOWER": {"IN": ["found", "discovered", "identified", "known"]}}, {"LOWER": "as", "OP": "?"}, {"ENT_TYPE": "PERSON"}],
+    # Detected by mentions of violence/death with persons
+    [{"LEMMA": {"IN": ["stab", "murder", "kill", "attack"]}}, {"OP": "*", "LENGTH": {"<=": 5}}, {"ENT_TYPE": "PERSON"}],
+    [{"ENT_TYPE": "PERSON"}, {"OP": "*", "LENGTH": {"<=": 5}}, {"LEMMA": {"IN": ["stab", "murder", "kill", "attack"]}}],
+]
+
+suspect_patterns = [
+    # Direct suspect mentions
+    [{"LOWER": {"IN": ["suspect", "suspects", "accused", "perpetrator", "attacker"]}}, {"IS_PUNCT": True, "OP": "?"}, {"OP": "*", "POS": {"NOT_IN": ["VERB", "PUNCT"]}}, {"ENT_TYPE": "PERSON"}],
+    # Subjects of arrest/detention
+    [{"ENT_TYPE": "PERSON"}, {"OP": "*", "POS": {"NOT_IN": ["VERB"]}}, {"LEMMA": {"IN": ["arrest", "detain", "charge", "apprehend"]}}],
+    # Persons detained or questioned
+    [{"LEMMA": {"IN": ["detain", "question", "arrest"]}}, {"OP": "*", "LENGTH": {"<=": 5}}, {"ENT_TYPE": "PERSON"}],
+    # Former associates with disputes
+    [{"LOWER": {"IN": ["former", "ex"]}}, {"LOWER": {"IN": ["partner", "associate", "colleague"]}}, {"OP": "*", "LENGTH": {"<=": 5}}, {"ENT_TYPE": "PERSON"}]
+]
+
+officer_patterns = [
+    # Officers with titles
+    [{"LOWER": {"IN": authority_patterns}}, {"IS_PUNCT": True, "OP": "?"}, {"OP": "*", "POS": {"NOT_IN": ["VERB", "PUNCT"]}}, {"ENT_TYPE": "PERSON"}],
+    # Officers leading investigations
+    [{"ENT_TYPE": "PERSON"}, {"OP": "*", "POS": {"NOT_IN": ["VERB"]}}, {"LEMMA": {"IN": ["lead", "investigate", "head", "supervise"]}}],
+    # Officers with their titles directly before their names
+    [{"LOWER": {"IN": authority_patterns}}, {"ENT_TYPE": "PERSON"}],
+    # Officers who stated something
+    [{"ENT_TYPE": "PERSON"}, {"OP": "*", "LENGTH": {"<=": 3}}, {"LEMMA": {"IN": ["state", "say", "mention", "report"]}}]
+]
+
+# Role matchers in the order they are applied: (label, entities key, patterns)
+role_rules = [
+    ("VICTIM", "victims", victim_patterns),
+    ("SUSPECT", "suspects", suspect_patterns),
+    ("OFFICER", "officers", officer_patterns)
+]
+
+# Result, duplicate and Doc caches live here
+CACHE_DIR = os.environ.get(
+    "CRIMECARD_CACHE_DIR",
+    os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", ".cache"))
+)
+
+class RuleEngine:
+    """Role and weapon matchers compiled once and shared by every report"""
+
+    def __init__(self, nlp):
+        from spacy.matcher import PhraseMatcher, Matcher
+
+        self.nlp = nlp
+        self.role_matchers = []
+        for label, role_type, patterns in role_rules:
+            matcher = Matcher(nlp.vocab)
+            matcher.add(label, patterns)
+            self.role_matchers.append((matcher, role_type))
+
+        # Weapon phrases only need tokenization, never the full pipeline
+        self.weapon_matcher = PhraseMatcher(nlp.vocab)
+        self.weapon_matcher.add("WEAPON", [nlp.make_doc(w) for w in weapon_keywords])
+
+rule_engine = None
+
+def load_rule_engine():
+    """Build the rule engine on first use"""
+    global rule_engine
+    if rule_engine is None:
+        rule_engine = RuleEngine(load_spacy())
+    return rule_engine
+
+keyword_index = None
+
+def load_keyword_index():
+    """Compile every scoring keyword into one automaton on first use"""
+    global keyword_index
+    if keyword_index is None:
+        from keywordIndex import KeywordAutomaton
+        keywords = list(weapon_keywords) + list(violence_keywords) + list(weapon_severity)
+        for terms in list(crime_keywords.values()) + list(direct_mentions.values()):
+            keywords.extend(terms)
+        for terms in [victim_keywords, suspect_keywords, officer_keywords, family_terms, authority_patterns,
+                      homicide_context_terms, definitive_homicide_terms, murder_terms,
+                      weapon_context_terms, context_keywords]:
+            keywords.extend(term.lower() for term in terms)
+        keyword_index = KeywordAutomaton(keywords)
+    return keyword_index
+
+def lower_text(text):
+    """Lowercase text without changing its length, so offsets line up with the Doc"""
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        lowered = "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+    return lowered
+
+def scan_keywords(text):
+    """Find every scoring keyword in the lowered text in a single pass"""
+    return load_keyword_index().search(lower_text(text))
+
+result_cache = None
+
+def package_version(name):
+    """Installed version of a package, without importing it"""
+    from importlib import metadata
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+def cache_fingerprint():
+    """Version of everything a cached result depends on: models, rules, vocabularies and code"""
+    import hashlib
+    service_dir = os.path.dirname(os.path.abspath(__file__))
+    code = hashlib.sha256()
+    for name in ["nlpService.py", "keywordIndex.py", "summarizerBackends.py", "nearDuplicates.py", "batchScoring.py"]:
+        with open(os.path.join(service_dir, name), "rb") as f:
+            code.update(f.read())
+    versions = {
+        "spacy": package_version("spacy"),
+        "spacy_profile": SPACY_PROFILE,
+        "spacy_model": package_version(spacy_profile()["model"]),
+        "transformers": package_version("transformers"),
+        "tensorflow": package_version("tensorflow"),
+        "pdfplumber": package_version("pdfplumber"),
+        "python-docx": package_version("python-docx"),
+        "summarizer": f"t5-small:{SUMMARIZER_BACKEND}",
+        "rules": role_rules,
+        "weapons": weapon_keywords,
+        "authority": authority_patterns,
+        "crime_keywords": crime_keywords,
+        "direct_mentions": direct_mentions,
+        "base_severity": base_severity,
+        "weapon_severity": weapon_severity,
+        "violence_keywords": violence_keywords,
+        "code": code.hexdigest()
+    }
+    return hashlib.sha256(json.dumps(versions, sort_keys=True).encode("utf-8")).hexdigest()
+
+def load_result_cache():
+    """Open the on-disk result cache, or return None when it is disabled or unavailable"""
+    global result_cache
+    if result_cache is None and os.environ.get("CRIMECARD_RESULT_CACHE", "1") != "0":
+        from resultCache import ResultCache
+        max_mb = float(os.environ.get("CRIMECARD_CACHE_MAX_MB", 256))
+        try:
+            result_cache = ResultCache(os.path.join(CACHE_DIR, "results.sqlite3"), cache_fingerprint(),
+                                       max_bytes=int(max_mb * 1024 * 1024))
+        except Exception as e:
+            print(f"Result cache unavailable: {str(e)}", file=sys.stderr)
+            result_cache = False
+    return result_cache or None
+
+duplicate_index = None
+
+def load_duplicate_index():
+    """Open the near-duplicate index, or return None when it is disabled or unavailable"""
+    global duplicate_index
+    if duplicate_index is None and os.environ.get("CRIMECARD_DEDUP", "1") != "0":
+        from nearDuplicates import NearDuplicateIndex
+        threshold = float(os.environ.get("CRIMECARD_DEDUP_THRESHOLD", 0.9))
+        try:
+            duplicate_index = NearDuplicateIndex(os.path.join(CACHE_DIR, "duplicates.sqlite3"), cache_fingerprint(),
+                                                 threshold=threshold)
+        except Exception as e:
+            print(f"Near-duplicate index unavailable: {str(e)}", file=sys.stderr)
+            duplicate_index = False
+    return duplicate_index or None
+
+# Parsed Docs saved for `rescore`: unset or "0" disables, "1" uses the cache
+# directory, anything else is the path of the store
+DOC_STORE = os.environ.get("CRIMECARD_DOC_STORE", "0")
+
+doc_store = None
+
+def load_doc_store():
+    """Open the parsed Doc store, or return None when it is disabled or unavailable"""
+    global doc_store
+    if doc_store is None and DOC_STORE != "0":
+        import hashlib
+        from docStore import DocStore
+        path = os.path.join(CACHE_DIR, "docs.sqlite3") if DOC_STORE == "1" else DOC_STORE
+        # Docs depend on the pipeline only, not on the rules that score them
+        version = hashlib.sha256(json.dumps({
+            "spacy": package_version("spacy"),
+            "spacy_profile": SPACY_PROFILE,
+            "spacy_model": package_version(spacy_profile()["model"])
+        }, sort_keys=True).encode("utf-8")).hexdigest()
+        try:
+            doc_store = DocStore(path, version)
+        except Exception as e:
+            print(f"Doc store unavailable: {str(e)}", file=sys.stderr)
+            doc_store = False
+    return doc_store or None
+
+def normalize_text(text):
+    """Normalize line endings and surrounding whitespace before hashing"""
+    return text.replace("\r\n", "\n").replace("\r", "\n").strip()
+
+# PDF extraction limits; the defaults come from the environment so the backend can set them
+PDF_MAX_PAGES = int(os.environ["PDF_MAX_PAGES"]) if os.environ.get("PDF_MAX_PAGES") else None
+PDF_MAX_BYTES = int(os.environ["PDF_MAX_BYTES"]) if os.environ.get("PDF_MAX_BYTES") else None
+PDF_WORKERS = int(os.environ.get("PDF_WORKERS", 1))
+# Below this many pages a process pool costs more than it saves
+PDF_PARALLEL_MIN_PAGES = 32
+
+def iter_pdf_pages(pdf_path, start=0, stop=None):
+    """Yield the text of each non-empty page in [start, stop), extracting every page once"""
+    import pdfplumber
     with pdfplumber.open(pdf_path) as pdf:
-        text = "\n".join([page.extract_text() for page in pdf.pages if page.extract_text()])
-    return text
+        for page in pdf.pages[start:stop]:
+            text = page.extract_text()
+            # Drop the page's parsed layout so memory stays flat on long documents
+            page.flush_cache()
+            if text:
+                yield text
+
+def extract_pdf_range(job):
+    """Text of one page range, run in a page-extraction worker"""
+    pdf_path, start, stop = job
+    return list(iter_pdf_pages(pdf_path, start, stop))
+
+def extract_pdf_pages(pdf_path, max_pages=None, max_bytes=None, workers=None):
+    """Stream the text of a PDF page by page.
+
+    Large files are split into page ranges spread across a process pool when
+    workers > 1; pages are still yielded in order. The pool's processes are
+    started fresh rather than forked, since `serve` and `http` call this from
+    threaded processes; they import only this module, not the models.
+    Extraction stops after max_pages pages or once max_bytes of text have
+    been produced.
+    """
+    import multiprocessing
+    max_pages = PDF_MAX_PAGES if max_pages is None else max_pages
+    max_bytes = PDF_MAX_BYTES if max_bytes is None else max_bytes
+    workers = PDF_WORKERS if workers is None else workers
+    
+    def page_texts():
+        # Pool workers (e.g. under `batch`) cannot start pools of their own
+        if workers > 1 and not multiprocessing.current_process().daemon:
+            import pdfplumber
+            with pdfplumber.open(pdf_path) as pdf:
+                page_count = len(pdf.pages)
+            if max_pages is not None:
+                page_count = min(page_count, max_pages)
+            if page_count >= PDF_PARALLEL_MIN_PAGES:
+                size = max(1, -(-page_count // (workers * 4)))
+                jobs = [(pdf_path, start, min(start + size, page_count)) for start in range(0, page_count, size)]
+                # Forking a threaded process can deadlock on a lock another thread held
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+                with context.Pool(workers) as pool:
+                    for texts in pool.imap(extract_pdf_range, jobs):
+                        yield from texts
+                return
+        yield from iter_pdf_pages(pdf_path, 0, max_pages)
+    
+    produced = 0
+    for text in page_texts():
+        size = len(text.encode("utf-8")) + 1
+        if max_bytes is not None and produced + size > max_bytes:
+            print(f"PDF text budget of {max_bytes} bytes reached, stopping early", file=sys.stderr)
+            break
+        produced += size
+        yield text
+
+def extract_text_from_pdf(pdf_path, **limits):
+    """Extract text from PDF files"""
+    return "\n".join(extract_pdf_pages(pdf_path, **limits))
 
 def extract_text_from_docx(docx_path):
     """Extract text from DOCX files"""
+    import docx
     doc = docx.Document(docx_path)
     return "\n".join([para.text for para in doc.paragraphs])
 
-def extract_entities(text):
+def extract_entities(text, doc=None, hits=None, timer=NULL_TIMER):
     """Enhanced entity extraction with relationship detection"""
-    doc = nlp(text)
+    if doc is None:
+        with timer.stage("parse"):
+            doc = parse(text)
+    if hits is None:
+        hits = scan_keywords(text)
+    laps = timer.laps("entities")
     entities = {
         "persons": [],
         "locations": [],
@@ -84,6 +490,7 @@ def extract_entities(text):
     # Named entities
     seen_locations = set()  # To track already seen locations
     seen_persons = set()    # To track already seen persons
+    seen_dates = set()      # To track already seen dates
     
     # First pass: extract all named entities
     for ent in doc.ents:
@@ -109,67 +516,26 @@ def extract_entities(text):
         elif ent.label_ == "DATE":
             # Better date filtering
             date_text = ent.text.strip()
-            if date_text and not any(word in date_text.lower() for word in ["year", "decade", "century"]):
+            if (date_text and date_text not in seen_dates
+                    and not any(word in date_text.lower() for word in ["year", "decade", "century"])):
                 entities["dates"].append(date_text)
-    
-    # More comprehensive role-detection patterns
-    victim_patterns = [
-        # Direct victim mentions
-        [{"LOWER": {"IN": ["victim", "victims"]}}, {"IS_PUNCT": True, "OP": "?"}, {"OP": "*", "POS": {"NOT_IN": ["VERB", "PUNCT"]}}, {"ENT_TYPE": "PERSON"}],
-        # Victims as objects of violence
-        [{"ENT_TYPE": "PERSON"}, {"OP": "*", "POS": {"NOT_IN": ["VERB"]}}, {"LEMMA": {"IN": ["found", "discover", "attack", "murder", "kill"]}}, {"POS": "ADP", "OP": "?"}],
-        # Found or discovered as victims
-        [{"LOWER": {"IN": ["found", "discovered", "identified", "known"]}}, {"LOWER": "as", "OP": "?"}, {"ENT_TYPE": "PERSON"}],
-        # Detected by mentions of violence/death with persons
-        [{"LEMMA": {"IN": ["stab", "murder", "kill", "attack"]}}, {"OP": "*", "LENGTH": {"<=": 5}}, {"ENT_TYPE": "PERSON"}],
-        [{"ENT_TYPE": "PERSON"}, {"OP": "*", "LENGTH": {"<=": 5}}, {"LEMMA": {"IN": ["stab", "murder", "kill", "attack"]}}],
-    ]
-    
-    suspect_patterns = [
-        # Direct suspect mentions
-        [{"LOWER": {"IN": ["suspect", "suspects", "accused", "perpetrator", "attacker"]}}, {"IS_PUNCT": True, "OP": "?"}, {"OP": "*", "POS": {"NOT_IN": ["VERB", "PUNCT"]}}, {"ENT_TYPE": "PERSON"}],
-        # Subjects of arrest/detention
-        [{"ENT_TYPE": "PERSON"}, {"OP": "*", "POS": {"NOT_IN": ["VERB"]}}, {"LEMMA": {"IN": ["arrest", "detain", "charge", "apprehend"]}}],
-        # Persons detained or questioned
-        [{"LEMMA": {"IN": ["detain", "question", "arrest"]}}, {"OP": "*", "LENGTH": {"<=": 5}}, {"ENT_TYPE": "PERSON"}],
-        # Former associates with disputes
-        [{"LOWER": {"IN": ["former", "ex"]}}, {"LOWER": {"IN": ["partner", "associate", "colleague"]}}, {"OP": "*", "LENGTH": {"<=": 5}}, {"ENT_TYPE": "PERSON"}]
-    ]
-    
-    officer_patterns = [
-        # Officers with titles
-        [{"LOWER": {"IN": authority_patterns}}, {"IS_PUNCT": True, "OP": "?"}, {"OP": "*", "POS": {"NOT_IN": ["VERB", "PUNCT"]}}, {"ENT_TYPE": "PERSON"}],
-        # Officers leading investigations
-        [{"ENT_TYPE": "PERSON"}, {"OP": "*", "POS": {"NOT_IN": ["VERB"]}}, {"LEMMA": {"IN": ["lead", "investigate", "head", "supervise"]}}],
-        # Officers with their titles directly before their names
-        [{"LOWER": {"IN": authority_patterns}}, {"ENT_TYPE": "PERSON"}],
-        # Officers who stated something
-        [{"ENT_TYPE": "PERSON"}, {"OP": "*", "LENGTH": {"<=": 3}}, {"LEMMA": {"IN": ["state", "say", "mention", "report"]}}]
-    ]
-    
-    # Create matchers for role identification
-    victim_matcher = Matcher(nlp.vocab)
-    victim_matcher.add("VICTIM", victim_patterns)
-    
-    suspect_matcher = Matcher(nlp.vocab)
-    suspect_matcher.add("SUSPECT", suspect_patterns)
-    
-    officer_matcher = Matcher(nlp.vocab)
-    officer_matcher.add("OFFICER", officer_patterns)
+                seen_dates.add(date_text)
+    laps.mark("named_entities")
     
     # Find roles
-    for matcher, role_type in [(victim_matcher, "victims"), (suspect_matcher, "suspects"), (officer_matcher, "officers")]:
+    rules = load_rule_engine()
+    for matcher, role_type in rules.role_matchers:
         matches = matcher(doc)
         for match_id, start, end in matches:
             span = doc[start:end]
             for ent in span.ents:
                 if ent.label_ == "PERSON" and ent.text not in entities[role_type]:
                     entities[role_type].append(ent.text)
+    laps.mark("role_matchers")
     
-    # Context-based role analysis - advanced pattern matching
-    victim_keywords = ["victim", "victims", "killed", "murdered", "attacked", "assaulted", "injured", "dead", "deceased", "found dead"]
-    suspect_keywords = ["suspect", "suspects", "accused", "perpetrator", "attacker", "arrested", "detained", "questioned"]
-    officer_keywords = ["police", "officer", "investigator", "detective", "ACP", "DCP", "SI", "PI", "said", "stated", "according to", "leading"]
+    # Every person and keyword mention, so proximity checks are offset lookups
+    from keywordIndex import MentionIndex
+    mentions = MentionIndex(lower_text(text), hits, entities["persons"])
     
     # Special handling for title + person patterns (like "DCP Sudhir Joshi")
     for token in doc:
@@ -183,77 +549,76 @@ def extract_entities(text):
                 potential_name = doc[token.i+1:token.i+3].text
                 if any(potential_name in person for person in entities["persons"]):
                     entities["officers"].append(potential_name)
+    laps.mark("mentions")
     
     # Process sentences to extract additional context with improved heuristics
     for sent in doc.sents:
         sent_text = sent.text.lower()
-        sent_doc = nlp(sent.text)
+        sent_hits = hits.between(sent.start_char, sent.end_char)
         
         # Murder/victim context
-        if any(term in sent_text for term in ["murder", "killed", "dead", "deceased"]):
+        if sent_hits.any(["murder", "killed", "dead", "deceased"]):
             for ent in sent.ents:
                 if ent.label_ == "PERSON" and ent.text not in entities["victims"]:
                     # Check if the person occurs in a victim context
-                    context = sent_text[max(0, sent_text.find(ent.text.lower())-50):sent_text.find(ent.text.lower())+50]
-                    if any(vk in context for vk in victim_keywords):
+                    window_start = max(sent.start_char, ent.start_char - 50)
+                    window_end = min(sent.end_char, ent.start_char + 50)
+                    if mentions.in_window(victim_keywords, window_start, window_end):
                         entities["victims"].append(ent.text)
         
         # Special handling for "found by" pattern to avoid misclassifying finders as victims
-        if "found by" in sent_text or "discovered by" in sent_text:
+        if "found by" in sent_hits or "discovered by" in sent_hits:
             for ent in sent.ents:
                 if ent.label_ == "PERSON":
                     # Check if this person is the finder
                     finder_context = ["found by", "discovered by"]
                     for fc in finder_context:
-                        if fc in sent_text and sent_text.find(fc) + len(fc) < sent_text.find(ent.text.lower()):
+                        if fc in sent_hits and sent_hits.first(fc) + len(fc) < ent.start_char - sent.start_char:
                             # This person is likely a finder, not a victim
-                            if ent.text in entities["victims"] and "daughter" in sent_text:
+                            if ent.text in entities["victims"] and "daughter" in sent_hits:
                                 entities["victims"].remove(ent.text)
         
         # Officer statements pattern
-        if any(term in sent_text for term in ["said", "stated", "according to"]):
+        if sent_hits.any(["said", "stated", "according to"]):
             for ent in sent.ents:
                 if ent.label_ == "PERSON" and ent.text not in entities["officers"]:
                     for term in ["said", "stated", "according to"]:
-                        if term in sent_text:
-                            position = sent_text.find(term)
-                            name_position = sent_text.find(ent.text.lower())
+                        if term in sent_hits:
+                            position = sent_hits.first(term)
+                            name_position = ent.start_char - sent.start_char
                             # If the name appears before the statement verb
                             if 0 <= name_position < position and position - name_position < 30:
                                 # Check if the person has an authority title nearby
-                                context = sent_text[max(0, name_position-20):name_position]
-                                if any(title.lower() in context for title in authority_patterns):
+                                title_start = max(sent.start_char, ent.start_char - 20)
+                                if mentions.in_window(authority_patterns, title_start, ent.start_char):
                                     entities["officers"].append(ent.text)
         
         # Investigation leadership pattern
-        if "lead" in sent_text or "leading" in sent_text or "heads" in sent_text:
+        if sent_hits.any(["lead", "leading", "heads"]):
             for ent in sent.ents:
                 if ent.label_ == "PERSON" and ent.text not in entities["officers"]:
                     probe_terms = ["investigation", "probe", "case"]
-                    if any(term in sent_text for term in probe_terms):
+                    if sent_hits.any(probe_terms):
                         entities["officers"].append(ent.text)
         
         # Explicit suspect identification
-        if "detained" in sent_text or "questioned" in sent_text or "arrested" in sent_text:
+        if sent_hits.any(["detained", "questioned", "arrested"]):
             for ent in sent.ents:
                 if ent.label_ == "PERSON" and ent.text not in entities["suspects"]:
                     # Make sure they're not already identified as a victim or officer
                     if ent.text not in entities["victims"] and ent.text not in entities["officers"]:
                         entities["suspects"].append(ent.text)
+    laps.mark("sentence_heuristics")
     
     # Weapon detection with improved context
-    weapon_matcher = PhraseMatcher(nlp.vocab)
-    weapon_patterns = [nlp(w) for w in weapon_keywords]
-    weapon_matcher.add("WEAPON", None, *weapon_patterns)
-    matches = weapon_matcher(doc)
+    matches = rules.weapon_matcher(doc)
     for _, start, end in matches:
         span = doc[start:end]
         weapon_text = span.text.lower()
         
         # Check for weapon context
-        for context in ["attacked with", "used", "wielding", "armed with"]:
-            context_pos = text.lower().find(context)
-            if context_pos != -1 and abs(context_pos - text.lower().find(weapon_text)) < 20:
+        for context in weapon_context_terms:
+            if mentions.near(context, span.start_char, 20):
                 if weapon_text not in entities["weapons"]:
                     entities["weapons"].append(span.text)
                 break
@@ -264,24 +629,25 @@ def extract_entities(text):
                 entities["weapons"].append(span.text)
     
     # Special case for common weapon mentions
-    if "stab" in text.lower() and "knife" not in entities["weapons"]:
-        if "kitchen knife" in text.lower():
+    if "stab" in hits and "knife" not in entities["weapons"]:
+        if "kitchen knife" in hits:
             entities["weapons"].append("kitchen knife")
         else:
             entities["weapons"].append("knife")
+    laps.mark("weapon_matcher")
     
     # Post-processing: Clean family relationships and remove conflicts
     
     # 1. Identify family relationships to avoid misclassification
-    family_terms = ["husband", "wife", "daughter", "son", "mother", "father", "sister", "brother", "spouse"]
     family_contexts = []
     
     for sent in doc.sents:
         sent_text = sent.text.lower()
+        sent_hits = hits.between(sent.start_char, sent.end_char)
         for term in family_terms:
-            if term in sent_text:
+            if term in sent_hits:
                 # Capture the context around the family term
-                term_pos = sent_text.find(term)
+                term_pos = sent_hits.first(term)
                 context = sent_text[max(0, term_pos-30):min(len(sent_text), term_pos+30)]
                 family_contexts.append(context)
     
@@ -291,8 +657,10 @@ def extract_entities(text):
     for person in list(entities["persons"]):
         if person in entities["victims"] and person in entities["suspects"]:
             # Prefer victim status if they were explicitly killed/murdered
-            murder_terms = ["killed", "murdered", "dead", "deceased", "stabbed"]
-            murder_context = any(term in text.lower()[text.lower().find(person.lower())-50:text.lower().find(person.lower())+50] for term in murder_terms)
+            murder_context = any(
+                mentions.in_window(murder_terms, max(0, position - 50), position + 50)
+                for position in mentions.chars(person)
+            )
             
             if murder_context:
                 if person in entities["suspects"]:
@@ -315,15 +683,15 @@ def extract_entities(text):
     
     # 3. Handle couples and paired victims
     couples = []
-    for i, person1 in enumerate(entities["persons"]):
-        for person2 in entities["persons"][i+1:]:
-            # Check if they appear together in the text
-            if abs(text.lower().find(person1.lower()) - text.lower().find(person2.lower())) < 20:
-                # And check if "and" or "&" or "," connects them
-                middle_text = text[min(text.lower().find(person1.lower()), text.lower().find(person2.lower())):
-                                   max(text.lower().find(person1.lower()), text.lower().find(person2.lower()))]
-                if " and " in middle_text or "&" in middle_text or "," in middle_text:
-                    couples.append((person1, person2))
+    person_order = {person: i for i, person in enumerate(entities["persons"])}
+    # Check if they appear together in the text
+    for person1, person2, start, end in mentions.close_pairs(entities["persons"], 20):
+        # And check if "and" or "&" or "," connects them
+        middle_text = text[start:end]
+        if " and " in middle_text or "&" in middle_text or "," in middle_text:
+            pair = tuple(sorted((person1, person2), key=person_order.get))
+            if pair not in couples:
+                couples.append(pair)
     
     # If one person in a couple is a victim, likely both are
     for person1, person2 in couples:
@@ -354,72 +722,195 @@ def extract_entities(text):
     # Ensure no duplicates in final lists
     for category in ["victims", "suspects", "officers"]:
         entities[category] = list(set(entities[category]))
+    laps.mark("post_processing")
     
     return entities
 
-def classify_crime(text, entities):
+# Reports longer than STREAM_MIN_CHARS are analyzed in overlapping windows of
+# about STREAM_WINDOW_CHARS instead of as one Doc, which would grow with the
+# document (and fails past nlp.max_length)
+STREAM_MIN_CHARS = int(os.environ.get("CRIMECARD_STREAM_MIN_CHARS", 200000))
+STREAM_WINDOW_CHARS = int(os.environ.get("CRIMECARD_STREAM_WINDOW_CHARS", 20000))
+STREAM_OVERLAP_SENTENCES = int(os.environ.get("CRIMECARD_STREAM_OVERLAP_SENTENCES", 3))
+
+SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|\n\s*\n")
+
+def current_rss_mb():
+    """Resident set size of this process in MB"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def iter_sentences(chunks, max_chars):
+    """Rough sentences, with their trailing whitespace, from a stream of text chunks.
+
+    Chunks are joined with newlines, as extract_text joins pages. Text with no
+    sentence break for max_chars is cut at a space so no piece grows unbounded.
+    """
+    buffer = ""
+    for n, chunk in enumerate(chunks):
+        buffer += ("\n" if n else "") + chunk
+        start = 0
+        for match in SENTENCE_BREAK.finditer(buffer):
+            yield buffer[start:match.end()]
+            start = match.end()
+        buffer = buffer[start:]
+        while len(buffer) > max_chars:
+            cut = buffer.rfind(" ", 0, max_chars) + 1 or max_chars
+            yield buffer[:cut]
+            buffer = buffer[cut:]
+    if buffer:
+        yield buffer
+
+def iter_windows(sentences, window_chars, overlap_sentences):
+    """Windows of whole sentences up to window_chars, each repeating the last sentences of the one before.
+
+    Yields (text, fresh), where text[fresh:] is the part not already in the
+    previous window.
+    """
+    window, size, carried = [], 0, 0
+    for sentence in sentences:
+        if size + len(sentence) > window_chars and len(window) > carried:
+            yield "".join(window), sum(len(s) for s in window[:carried])
+            window = window[max(1, len(window) - overlap_sentences):] if overlap_sentences else []
+            # The overlap is context, never more than half a window
+            while window and sum(len(s) for s in window) > window_chars // 2:
+                window.pop(0)
+            carried = len(window)
+            size = sum(len(s) for s in window)
+        window.append(sentence)
+        size += len(sentence)
+    if len(window) > carried:
+        yield "".join(window), sum(len(s) for s in window[:carried])
+
+def extract_entities_streaming(chunks, window_chars=None, overlap_sentences=None, batch_size=4, sentences=None):
+    """extract_entities over a document of any length in bounded memory.
+
+    The text (a stream of chunks, such as PDF pages) is cut into overlapping
+    sentence-aligned windows that go through nlp.pipe a few at a time, and each
+    window's entities are merged in order of first appearance; the overlap
+    keeps entities and role cues at a window edge whole in at least one
+    window. Like every other category, dates are listed once each. If
+    sentences is a list, the document's sentence texts are appended to it.
+    Returns (entities, stats) with the windows processed and peak RSS.
+    """
+    global pipeline_calls
+    from collections import deque
+    
+    window_chars = window_chars or STREAM_WINDOW_CHARS
+    overlap_sentences = STREAM_OVERLAP_SENTENCES if overlap_sentences is None else overlap_sentences
+    categories = ["persons", "locations", "dates", "weapons", "actions", "victims", "suspects", "officers"]
+    merged = {category: [] for category in categories}
+    merged["ages"] = {}
+    seen = {category: set() for category in categories}
+    stats = {"windows": 0, "chars": 0, "peak_rss_mb": current_rss_mb()}
+    
+    # Fresh offsets of the windows handed to nlp.pipe but not yet returned
+    fresh_offsets = deque()
+    
+    def texts():
+        for text, fresh in iter_windows(iter_sentences(chunks, window_chars), window_chars, overlap_sentences):
+            fresh_offsets.append(fresh)
+            yield text
+    
+    for doc in load_spacy().pipe(texts(), batch_size=batch_size):
+        pipeline_calls += 1
+        fresh = fresh_offsets.popleft()
+        entities = extract_entities(doc.text, doc)
+        # Role lists come back unordered; keep them in order of first mention
+        order = {person: i for i, person in enumerate(entities["persons"])}
+        for category in ["victims", "suspects", "officers"]:
+            entities[category].sort(key=lambda name: (order.get(name, len(order)), name))
+        for category in categories:
+            for value in entities[category]:
+                if value not in seen[category]:
+                    seen[category].add(value)
+                    merged[category].append(value)
+        for person, age in entities["ages"].items():
+            merged["ages"].setdefault(person, age)
+        if sentences is not None:
+            sentences.extend(sent.text for sent in doc.sents if sent.start_char >= fresh)
+        stats["windows"] += 1
+        stats["chars"] += len(doc.text) - fresh
+        stats["peak_rss_mb"] = max(stats["peak_rss_mb"], current_rss_mb())
+    
+    # Windows judge roles separately; officer status still wins over the others
+    officers = seen["officers"]
+    merged["victims"] = [person for person in merged["victims"] if person not in officers]
+    merged["suspects"] = [person for person in merged["suspects"] if person not in officers]
+    
+    stats["peak_rss_mb"] = round(stats["peak_rss_mb"], 1)
+    return merged, stats
+
+def weapon_crime_scores(weapon):
+    """Classification boosts implied by one extracted weapon"""
+    weapon_lower = weapon.lower()
+    if any(w in weapon_lower for w in ["gun", "pistol", "firearm", "rifle"]):
+        return {"homicide": 2}
+    elif any(w in weapon_lower for w in ["knife", "stab", "blade"]):
+        return {"homicide": 1, "assault": 1}
+    elif "acid" in weapon_lower:
+        return {"acid_attack": 5}
+    return {}
+
+def weapon_severity_boost(weapon):
+    """Severity boost of the first weapon_severity key found in a weapon"""
+    for key, value in weapon_severity.items():
+        if key in weapon.lower():
+            return value
+    return 0
+
+def classify_crime(text, entities, hits=None):
     """Classify crime type with improved confidence calculation"""
-    doc = nlp(text.lower())
+    if hits is None:
+        hits = scan_keywords(text)
     crime_scores = {crime: 0 for crime in crime_keywords}
     
     # Check for explicit mentions of crime types
-    direct_mentions = {
-        "homicide": ["murder", "homicide", "killing", "killed", "murdered", "double homicide", "double murder"],
-        "theft": ["theft", "robbery", "burglary", "stolen", "robbed"],
-        "assault": ["assault", "attack", "battery", "beaten", "assaulted"],
-        "fraud": ["fraud", "scam", "cheated", "swindled"],
-        "drug": ["drug", "narcotics", "cocaine", "heroin", "marijuana"],
-        "acid_attack": ["acid attack", "acid throwing", "chemical attack"],
-        "kidnapping": ["kidnapping", "abduction", "kidnapped", "abducted"]
-    }
-    
     for crime, mentions in direct_mentions.items():
         for mention in mentions:
-            if mention in text.lower():
+            if mention in hits:
                 crime_scores[crime] += 3  # Higher weight for direct mentions
     
     # Keyword-based scoring
     for crime, keywords in crime_keywords.items():
         for keyword in keywords:
-            if keyword in text.lower():
+            if keyword in hits:
                 crime_scores[crime] += 1
     
     # Context-based improvements
     if len(entities["victims"]) > 0:
         # Check for murder context with victims
-        murder_context = any(term in text.lower() for term in ["kill", "killed", "murder", "murdered", "dead", "deceased"])
+        murder_context = hits.any(homicide_context_terms)
         if murder_context:
             crime_scores["homicide"] += 3
     
     # Look for definitive evidence of homicide
-    definitive_homicide = any(term in text.lower() for term in ["brutally murdered", "found dead", "found murdered"])
+    definitive_homicide = hits.any(definitive_homicide_terms)
     if definitive_homicide:
         crime_scores["homicide"] += 5
     
     # Multiple victims strongly suggests homicide when victims are "found"
-    if len(entities["victims"]) > 1 and "found" in text.lower():
+    if len(entities["victims"]) > 1 and "found" in hits:
         crime_scores["homicide"] += 2
     
     # Weapon context for different crimes
     if entities.get("weapons"):
         for weapon in entities["weapons"]:
-            weapon_lower = weapon.lower()
-            if any(w in weapon_lower for w in ["gun", "pistol", "firearm", "rifle"]):
-                crime_scores["homicide"] += 2
-            elif any(w in weapon_lower for w in ["knife", "stab", "blade"]):
-                crime_scores["homicide"] += 1
-                crime_scores["assault"] += 1
-            elif "acid" in weapon_lower:
-                crime_scores["acid_attack"] += 5
+            for crime, boost in weapon_crime_scores(weapon).items():
+                crime_scores[crime] += boost
     
     # If no clear crime type, use context clues
     if not any(crime_scores.values()):
-        if "stab" in text.lower() or "knife" in text.lower():
+        if hits.any(fallback_assault_terms):
             crime_scores["assault"] += 1
-            if "dead" in text.lower() or "death" in text.lower():
+            if hits.any(fallback_homicide_terms):
                 crime_scores["homicide"] += 2
         
-        if "money" in text.lower() or "financial" in text.lower():
+        if hits.any(fallback_fraud_terms):
             crime_scores["fraud"] += 1
     
     if not any(crime_scores.values()):
@@ -434,68 +925,48 @@ def classify_crime(text, entities):
     
     return predicted_crime, min(1.0, confidence)
 
-def calculate_severity(text, crime_type, entities):
+def calculate_severity(text, crime_type, entities, hits=None):
     """Calculate severity score with improved context awareness"""
-    # Base severity by crime type
-    base_severity = {
-        "homicide": 9,
-        "assault": 6,
-        "theft": 4,
-        "fraud": 3,
-        "drug": 5,
-        "acid_attack": 8,
-        "kidnapping": 8,
-        "sexual_assault": 8,
-        "other": 3
-    }
-    
     # Start with base score for the crime type
     severity_score = base_severity.get(crime_type, 3)
     
     # Adjust based on factors
     
     # Weapon presence and type
-    weapon_severity = {
-        "gun": 3,
-        "firearm": 3,
-        "pistol": 3,
-        "rifle": 3,
-        "knife": 2,
-        "acid": 3,
-        "bomb": 4,
-        "explosive": 4
-    }
-    
     for weapon in entities["weapons"]:
-        for key, value in weapon_severity.items():
-            if key in weapon.lower():
-                severity_score += value
-                break
+        severity_score += weapon_severity_boost(weapon)
     
     # Number of victims
     if len(entities["victims"]) > 1:
         severity_score += min(len(entities["victims"]), 3)  # Up to +3 for multiple victims
     
     # Check for particularly violent keywords
-    violence_keywords = {
-        "brutally": 1.5,
-        "horrific": 1.5,
-        "gruesome": 1.5,
-        "multiple stab": 2,
-        "pool of blood": 1,
-        "critical condition": 1.5,
-        "severe injuries": 1
-    }
-    
-    text_lower = text.lower()
+    if hits is None:
+        hits = scan_keywords(text)
     for keyword, boost in violence_keywords.items():
-        if keyword in text_lower:
+        if keyword in hits:
             severity_score += boost
     
     # Cap at 10
     return min(10, max(1, round(severity_score)))
 
-def generate_summary(text, max_length=150):
+batch_scorer = None
+
+def load_batch_scorer():
+    """Compile the scoring tables into NumPy weight matrices on first use"""
+    global batch_scorer
+    if batch_scorer is None:
+        from batchScoring import BatchScorer
+        batch_scorer = BatchScorer(sys.modules[__name__])
+    return batch_scorer
+
+def score_reports(texts, entities_list, hits_list=None):
+    """classify_crime and calculate_severity for many reports in one vectorized pass"""
+    if hits_list is None:
+        hits_list = [scan_keywords(text) for text in texts]
+    return load_batch_scorer().score(hits_list, entities_list)
+
+def generate_summary(text, max_length=150, doc=None):
     """Generate summary using T5 model with improved fallback"""
     try:
         # Preprocess text
@@ -503,17 +974,18 @@ def generate_summary(text, max_length=150):
         
         # Skip summarization for very short texts
         if len(clean_text.split()) < 20:
-            return extractive_fallback(text)
-            
+            return extractive_fallback(text, doc)
+        
+        tokenizer, model = load_summarizer()
         inputs = tokenizer.encode(
             "summarize: " + clean_text,
-            return_tensors="tf",
+            return_tensors=model.tensor_type,
             max_length=512,
             truncation=True
         )
         
         outputs = model.generate(
-            inputs,
+            input_ids=inputs,
             max_length=max_length,
             min_length=30,
             length_penalty=2.0,
@@ -525,8 +997,268 @@ def generate_summary(text, max_length=150):
         return format_summary(summary)
         
     except Exception as e:
-        print(f"Summarization error: {str(e)}")
-        return extractive_fallback(text)
+        print(f"Summarization error: {str(e)}", file=sys.stderr)
+        return extractive_fallback(text, doc)
+
+def generate_summaries(text, doc=None, max_length=150, headline_length=75):
+    """Generate the summary and the headline from a single T5 beam search.
+
+    The beams returned for the summary are reused for the headline: it is the
+    best beam that fits in headline_length tokens, or the best beam cut down
+    to that length when none fits.
+    """
+    summary, headline, _ = generate_summaries_batch([text], [doc], max_length, headline_length)[0]
+    return summary, headline
+
+# T5 input window, and the token budget for each chunk of a longer document
+SUMMARY_INPUT_TOKENS = 512
+SUMMARY_CHUNK_TOKENS = 480
+SUMMARY_MAX_ROUNDS = 5
+
+# Running estimate of decode cost per beam per output token, refined after every generate call
+decode_seconds_per_token = float(os.environ.get("NLP_DECODE_SECONDS_PER_TOKEN", 0.004))
+# Every decode runs on one thread, so a decode abandoned at its deadline (which keeps
+# running until it finishes) never overlaps another
+decoder = None
+decoder_lock = threading.Lock()
+abandoned_decode = None
+
+class BudgetExceeded(Exception):
+    pass
+
+class LatencyBudget:
+    """Optional deadline (a time.monotonic() value) shared by one request's summarization calls"""
+
+    def __init__(self, deadline=None):
+        self.deadline = deadline
+
+    def remaining(self):
+        import time
+        return None if self.deadline is None else self.deadline - time.monotonic()
+
+    def choose_decoding(self, batch_size, max_length, num_beams=4):
+        """Largest (beams, max_length) expected to finish in the remaining time, or None"""
+        remaining = self.remaining()
+        if remaining is None:
+            return num_beams, max_length
+        # Keep a margin for tokenizing, decoding and the extractive fallback itself
+        available = remaining * 0.8
+        for beams in (num_beams, 2, 1):
+            for length in (max_length, max_length * 2 // 3, max(40, max_length // 2)):
+                if decode_seconds_per_token * batch_size * beams * length <= available:
+                    return beams, length
+        return None
+
+def run_generate(model, budget, **kwargs):
+    """model.generate on the decode thread, abandoned with BudgetExceeded if it cannot finish before the deadline.
+
+    Calls without a deadline wait their turn behind any abandoned decode
+    instead of running alongside it.
+    """
+    global decoder, abandoned_decode, decode_seconds_per_token
+    import time
+    import concurrent.futures
+    
+    start = time.perf_counter()
+    remaining = budget.remaining()
+    if remaining is not None and abandoned_decode is not None and not abandoned_decode.done():
+        # The model is still busy with a decode that already missed its deadline
+        raise BudgetExceeded()
+    with decoder_lock:
+        if decoder is None:
+            decoder = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="decode")
+        future = decoder.submit(lambda: model.generate(**kwargs))
+    try:
+        outputs = future.result(timeout=None if remaining is None else max(0.0, remaining))
+    except concurrent.futures.TimeoutError:
+        abandoned_decode = future
+        raise BudgetExceeded()
+    
+    # Refine the cost estimate from this call
+    beam_tokens = kwargs["num_beams"] * outputs.shape[0] * outputs.shape[1] / kwargs["num_return_sequences"]
+    if beam_tokens:
+        observed = (time.perf_counter() - start) / beam_tokens
+        decode_seconds_per_token = 0.7 * decode_seconds_per_token + 0.3 * observed
+    return outputs
+
+def pack_chunks(units, tokenizer, budget=SUMMARY_CHUNK_TOKENS):
+    """Group consecutive sentences (or partial summaries) into chunks of at most budget tokens"""
+    lengths = [len(ids) for ids in tokenizer(units, add_special_tokens=False)["input_ids"]]
+    chunks, current, size = [], [], 0
+    for unit, length in zip(units, lengths):
+        if current and size + length > budget:
+            chunks.append(" ".join(current))
+            current, size = [], 0
+        current.append(unit)
+        size += length
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+def summarize_chunks(chunks, max_length=150, budget=None):
+    """Summaries for many chunks in one batched generate, reusing cached chunk summaries.
+
+    Returns the summaries and whether any of them had to be degraded to meet the budget.
+    """
+    cache = load_result_cache()
+    summaries = [None] * len(chunks)
+    keys = [None] * len(chunks)
+    if cache is not None:
+        from resultCache import content_key
+        for i, chunk in enumerate(chunks):
+            keys[i] = content_key(chunk, str(max_length))
+            summaries[i] = cache.get("chunk", keys[i])
+    
+    missing = [i for i, summary in enumerate(summaries) if summary is None]
+    # Very short chunks are already as short as a summary would be
+    to_model = [i for i in missing if len(chunks[i].split()) >= 20]
+    for i in missing:
+        if i not in to_model:
+            summaries[i] = chunks[i]
+    
+    degraded = False
+    if to_model:
+        generated = generate_summaries_batch([chunks[i] for i in to_model], max_length=max_length,
+                                             long_documents=False, budget=budget)
+        for i, (summary, _, info) in zip(to_model, generated):
+            summaries[i] = summary
+            degraded = degraded or info["degraded"]
+            if cache is not None and not info["degraded"]:
+                cache.put("chunk", keys[i], summary)
+    return summaries, degraded
+
+def summarize_long_texts(texts, docs, max_length=150, headline_length=75, budget=None):
+    """Map-reduce summarization for texts longer than the T5 input window.
+
+    Each text is split at sentence boundaries into token-budgeted chunks, all
+    chunks are summarized together, and the partial summaries are combined and
+    summarized again until they fit in one window.
+    """
+    tokenizer, _ = load_summarizer()
+    units = []
+    for text, doc in zip(texts, docs):
+        units.append([sent.strip() for sent in sentence_texts(text, doc) if sent.strip()])
+    
+    degraded = False
+    for _ in range(SUMMARY_MAX_ROUNDS):
+        groups = [pack_chunks(sentences, tokenizer) for sentences in units]
+        if all(len(chunks) <= 1 for chunks in groups):
+            break
+        flat = [chunk for chunks in groups if len(chunks) > 1 for chunk in chunks]
+        partials, round_degraded = summarize_chunks(flat, max_length, budget)
+        degraded = degraded or round_degraded
+        partials = iter(partials)
+        units = [[next(partials) for _ in chunks] if len(chunks) > 1 else chunks for chunks in groups]
+    
+    combined = [" ".join(sentences) for sentences in units]
+    results = generate_summaries_batch(combined, max_length=max_length, headline_length=headline_length,
+                                       long_documents=False, budget=budget)
+    for _, _, info in results:
+        info["summarizer"] = "t5-long" if info["summarizer"] == "t5" else info["summarizer"]
+        info["degraded"] = info["degraded"] or degraded
+    return results
+
+def generate_summaries_batch(texts, docs=None, max_length=150, headline_length=75, long_documents=True,
+                             budget=None):
+    """Summary, headline and summarizer info for several texts with one padded T5 generate call.
+
+    With long_documents, texts longer than the T5 input window are summarized
+    chunk by chunk instead of being truncated. With a budget, beam count and
+    length shrink to fit the remaining time, and the extractive fallback is
+    used once there is no time left for the model.
+    """
+    docs = docs or [None] * len(texts)
+    budget = budget or LatencyBudget()
+    results = [None] * len(texts)
+    pending = []  # (index, cleaned text) for texts that go through the model
+    
+    def fallback(i, degraded):
+        summary = extractive_fallback(texts[i], docs[i])
+        return (summary, summary, {"summarizer": "extractive", "degraded": degraded})
+    
+    for i, text in enumerate(texts):
+        # Preprocess text
+        clean_text = ' '.join(text.replace('\n', ' ').split())
+        
+        # Skip summarization for very short texts
+        if len(clean_text.split()) < 20:
+            results[i] = fallback(i, False)
+        else:
+            pending.append((i, clean_text))
+    
+    if not pending:
+        return results
+    
+    try:
+        tokenizer, model = load_summarizer()
+        
+        if long_documents:
+            lengths = [len(ids) for ids in tokenizer(["summarize: " + clean_text for _, clean_text in pending])["input_ids"]]
+            long_items = [i for (i, _), length in zip(pending, lengths) if length > SUMMARY_INPUT_TOKENS]
+            if long_items:
+                long_results = summarize_long_texts([texts[i] for i in long_items], [docs[i] for i in long_items],
+                                                    max_length, headline_length, budget)
+                for i, result in zip(long_items, long_results):
+                    results[i] = result
+                pending = [(i, clean_text) for i, clean_text in pending if results[i] is None]
+                if not pending:
+                    return results
+        
+        decoding = budget.choose_decoding(len(pending), max_length)
+        if decoding is None:
+            raise BudgetExceeded()
+        num_beams, decode_length = decoding
+        info = {"summarizer": "t5", "degraded": (num_beams, decode_length) != (4, max_length),
+                "num_beams": num_beams, "max_length": decode_length}
+        
+        inputs = tokenizer(
+            ["summarize: " + clean_text for _, clean_text in pending],
+            return_tensors=model.tensor_type,
+            max_length=SUMMARY_INPUT_TOKENS,
+            truncation=True,
+            padding=True
+        )
+        
+        outputs = run_generate(
+            model,
+            budget,
+            input_ids=inputs["input_ids"],
+            attention_mask=inputs["attention_mask"],
+            max_length=decode_length,
+            min_length=30,
+            length_penalty=2.0,
+            num_beams=num_beams,
+            num_return_sequences=num_beams,
+            early_stopping=True
+        )
+        
+        for k, (i, _) in enumerate(pending):
+            beams = outputs[k * num_beams:(k + 1) * num_beams]
+            summary = tokenizer.decode(beams[0], skip_special_tokens=True)
+            
+            # Beams come back best first; lengths include the decoder start token
+            headline_ids = None
+            for beam in beams:
+                if int((beam != tokenizer.pad_token_id).sum()) + 1 <= headline_length:
+                    headline_ids = beam
+                    break
+            if headline_ids is None:
+                headline_ids = beams[0][:headline_length]
+            headline = tokenizer.decode(headline_ids, skip_special_tokens=True)
+            
+            results[i] = (format_summary(summary), format_summary(headline), dict(info))
+    
+    except BudgetExceeded:
+        # Out of time for the model: answer with the extractive summary instead
+        for i, _ in pending:
+            results[i] = fallback(i, True)
+    
+    except Exception as e:
+        print(f"Summarization error: {str(e)}", file=sys.stderr)
+        for i, _ in pending:
+            results[i] = fallback(i, True)
+    
+    return results
 
 def format_summary(text):
     """Format summary text properly"""
@@ -535,10 +1267,17 @@ def format_summary(text):
         text += '.'
     return text[0].upper() + text[1:]
 
-def extractive_fallback(text):
+def sentence_texts(text, doc=None):
+    """Sentences of a report, from its Doc or from the list kept when it was analyzed in windows"""
+    if isinstance(doc, list):
+        return doc
+    if doc is None:
+        doc = parse(text)
+    return [sent.text for sent in doc.sents]
+
+def extractive_fallback(text, doc=None):
     """Improved fallback extractive summarization"""
-    doc = nlp(text)
-    sentences = [sent.text.strip() for sent in doc.sents]
+    sentences = [sent.strip() for sent in sentence_texts(text, doc)]
     
     # Score sentences by position and keyword significance
     sentence_scores = {}
@@ -569,21 +1308,54 @@ def extractive_fallback(text):
     
     return format_summary(" ".join([sent for sent, score in original_order]))
 
-def process_text(text):
-    """Enhanced main processing function"""
+def analyze_text(text, doc, timer=NULL_TIMER):
+    """Entities, classification and severity for one parsed report"""
+    # Scan for every scoring keyword once; all stages read the same hits
+    with timer.stage("keywords"):
+        hits = scan_keywords(text)
+    
     # Extract entities with improved context understanding
-    entities = extract_entities(text)
+    entities = extract_entities(text, doc, hits, timer)
     
     # Classify crime type with entity information
-    crime_type, confidence = classify_crime(text, entities)
+    with timer.stage("classify"):
+        crime_type, confidence = classify_crime(text, entities, hits)
     
     # Calculate severity score based on crime and entities
-    severity = calculate_severity(text, crime_type, entities)
+    with timer.stage("severity"):
+        severity = calculate_severity(text, crime_type, entities, hits)
+    
+    timer.count("chars", len(text))
+    timer.count("tokens", len(doc))
     
-    # Generate summaries
-    summary = generate_summary(text, max_length=150)
-    headline = generate_summary(text, max_length=75)
+    return entities, crime_type, confidence, severity
+
+def analyze_long_text(text, timer=NULL_TIMER):
+    """analyze_text for a report too long for one Doc.
+
+    Returns the analysis, the report's sentences (which stand in for its Doc
+    when summarizing) and the streaming stats.
+    """
+    sentences = []
+    with timer.stage("entities.streaming"):
+        entities, stats = extract_entities_streaming([text], sentences=sentences)
     
+    with timer.stage("keywords"):
+        hits = scan_keywords(text)
+    
+    with timer.stage("classify"):
+        crime_type, confidence = classify_crime(text, entities, hits)
+    
+    with timer.stage("severity"):
+        severity = calculate_severity(text, crime_type, entities, hits)
+    
+    timer.count("chars", len(text))
+    timer.count("windows", stats["windows"])
+    
+    return (entities, crime_type, confidence, severity), sentences, stats
+
+def build_result(entities, crime_type, confidence, severity, summary, headline, summary_info=None):
+    """Assemble the JSON result returned for a report"""
     # Format the output
     result = {
         "entities": entities,
@@ -594,6 +1366,11 @@ def process_text(text):
         "headline": headline
     }
     
+    # Record how the summary was produced
+    if summary_info is not None:
+        result["summarizer"] = summary_info["summarizer"]
+        result["summaryTimeMs"] = summary_info["elapsed_ms"]
+    
     # Add detailed victim information if available
     if entities["victims"]:
         result["primary_victim"] = entities.get("victims", [])
@@ -621,6 +1398,698 @@ def process_text(text):
     
     return result
 
+# Attach a per-stage "timings" block to every process result
+TIMINGS = os.environ.get("CRIMECARD_TIMINGS", "0") == "1"
+
+def process_text(text, deadline=None, timings=False, on_analysis=None, dedup=True):
+    """Enhanced main processing function.
+
+    deadline is an optional time.monotonic() value; summarization degrades to
+    fit it and falls back to extractive_fallback when time runs out. With
+    dedup off the report is neither matched against nor added to the
+    near-duplicate index.
+    """
+    return process_texts([text], [deadline], [timings], [on_analysis], [dedup])[0]
+
+def process_texts(texts, deadlines=None, timings=None, on_analysis=None, dedup=None):
+    """Process several reports together: one nlp.pipe pass and one padded T5 generate.
+
+    Reports already analyzed with the current models and rules come straight
+    from the result cache; with the Doc store enabled, reports parsed before
+    skip the pipeline. Reports over STREAM_MIN_CHARS are analyzed in windows. Reports with deadlines share the strictest one.
+    Reports with timings set get a "timings" block; parse and summary are
+    batch stages, so their times cover the whole batch. on_analysis callbacks
+    receive each report's result without the summary as soon as it is known.
+    Reports whose dedup flag is off skip the near-duplicate index.
+    """
+    import time
+    from stageTimer import StageTimer
+    
+    timings = timings or [False] * len(texts)
+    dedup = dedup or [True] * len(texts)
+    timers = [StageTimer() if TIMINGS or timed else None for timed in timings]
+    batch_timer = StageTimer() if any(timers) else NULL_TIMER
+    
+    cache = load_result_cache()
+    duplicates = load_duplicate_index()
+    results = [None] * len(texts)
+    keys = [None] * len(texts)
+    if cache is not None or duplicates is not None or load_doc_store() is not None:
+        from resultCache import content_key
+        keys = [content_key(normalize_text(text)) for text in texts]
+    if cache is not None:
+        for i in range(len(texts)):
+            with (timers[i] or NULL_TIMER).stage("cache"):
+                results[i] = cache.get("process", keys[i])
+            # A cached near-duplicate match holds another report's analysis
+            if not dedup[i] and results[i] is not None and "duplicateOf" in results[i]:
+                results[i] = None
+    
+    # A rewrite or re-upload of an already analyzed report reuses that analysis
+    signatures = [None] * len(texts)
+    if duplicates is not None:
+        for i, text in enumerate(texts):
+            if results[i] is None and dedup[i]:
+                with (timers[i] or NULL_TIMER).stage("dedup"):
+                    signatures[i] = duplicates.signature(text)
+                    match = duplicates.query(signatures[i])
+                if match is not None:
+                    key, similarity, result = match
+                    results[i] = dict(result, reportKey=keys[i], duplicateOf=key, similarity=round(similarity, 3))
+                    if cache is not None:
+                        cache.put("process", keys[i], results[i])
+    
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        pending = [texts[i] for i in missing]
+        
+        # A report parsed before only needs re-scoring; its summary stands if
+        # the same summarizer wrote it
+        docs = [None] * len(pending)
+        summaries = [None] * len(pending)
+        store = load_doc_store()
+        if store is not None:
+            vocab = load_spacy().vocab
+            for k, i in enumerate(missing):
+                with (timers[i] or NULL_TIMER).stage("docstore"):
+                    saved = store.get(keys[i], vocab)
+                if saved is None:
+                    continue
+                docs[k], summary = saved
+                pending[k] = docs[k].text
+                if summary["engine"] == SUMMARIZER_BACKEND:
+                    summaries[k] = (summary["summary"], summary["headline"],
+                                    {"summarizer": summary["summarizer"], "elapsed_ms": summary["elapsed_ms"],
+                                     "degraded": False})
+        # Very long reports never become a single Doc
+        streamed = {k: None for k, doc in enumerate(docs) if doc is None and len(pending[k]) > STREAM_MIN_CHARS}
+        parsed = [k for k, doc in enumerate(docs) if doc is None and k not in streamed]
+        
+        # Parse once; every stage below reuses the same Doc
+        if parsed:
+            with batch_timer.stage("parse"):
+                for k, doc in zip(parsed, parse_many([pending[k] for k in parsed])):
+                    docs[k] = doc
+        analyses = [None] * len(pending)
+        for k, (i, text) in enumerate(zip(missing, pending)):
+            if k in streamed:
+                analyses[k], docs[k], streamed[k] = analyze_long_text(text, timers[i] or NULL_TIMER)
+            else:
+                analyses[k] = analyze_text(text, docs[k], timers[i] or NULL_TIMER)
+        
+        # Entities and classification are ready well before the summary
+        if on_analysis:
+            for i, analysis in zip(missing, analyses):
+                if on_analysis[i] is not None:
+                    partial = build_result(*analysis, None, None)
+                    del partial["summary"], partial["headline"]
+                    on_analysis[i](partial)
+        
+        # Generate summary and headline from one T5 call per group of deadlines
+        deadlines = deadlines or [None] * len(texts)
+        summarized = [k for k, summary in enumerate(summaries) if summary is None]
+        groups = [
+            [k for k in summarized if deadlines[missing[k]] is None],
+            [k for k in summarized if deadlines[missing[k]] is not None]
+        ]
+        for group in groups:
+            if not group:
+                continue
+            group_deadlines = [deadlines[missing[k]] for k in group if deadlines[missing[k]] is not None]
+            budget = LatencyBudget(min(group_deadlines) if group_deadlines else None)
+            start = time.perf_counter()
+            with batch_timer.stage("summary"):
+                generated = generate_summaries_batch([pending[k] for k in group], [docs[k] for k in group],
+                                                     budget=budget)
+            elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+            for k, (summary, headline, info) in zip(group, generated):
+                info["elapsed_ms"] = elapsed_ms
+                summaries[k] = (summary, headline, info)
+        
+        for k, (i, analysis, (summary, headline, info)) in enumerate(zip(missing, analyses, summaries)):
+            results[i] = build_result(*analysis, summary, headline, info)
+            if keys[i] is not None:
+                results[i]["reportKey"] = keys[i]
+            if k in streamed:
+                results[i]["streaming"] = {"windows": streamed[k]["windows"], "peakRssMb": streamed[k]["peak_rss_mb"]}
+            # Summaries cut short by a deadline are not worth keeping
+            if info["degraded"]:
+                continue
+            if store is not None and k not in streamed and (k in parsed or k in summarized):
+                with (timers[i] or NULL_TIMER).stage("docstore"):
+                    store.put(keys[i], docs[k], {"summary": summary, "headline": headline, "engine": SUMMARIZER_BACKEND,
+                                                 "summarizer": info["summarizer"], "elapsed_ms": info["elapsed_ms"]})
+            if cache is not None:
+                cache.put("process", keys[i], results[i])
+            if duplicates is not None and dedup[i]:
+                duplicates.add(keys[i], signatures[i], results[i])
+    
+    for i, timer in enumerate(timers):
+        if timer is not None:
+            if i in missing:
+                timer.merge(batch_timer)
+                timer.count("batch_size", len(missing))
+            report = timer.report()
+            report["cached"] = i not in missing
+            results[i] = dict(results[i], timings=report)
+    
+    return results
+
+# Fields of the manual report form, with the labels the backend joined them under
+FORM_FIELDS = [("crimeType", "Crime Type"), ("victim", "Victim"), ("suspect", "Suspect"), ("location", "Location"),
+               ("date", "Date"), ("weapon", "Weapon"), ("description", "Description")]
+
+def form_fields(fields):
+    """The form's fields as stripped strings, missing ones empty"""
+    return {name: str(fields.get(name) or "").strip() for name, _ in FORM_FIELDS}
+
+def assemble_form(fields, description_result=None, timings=False):
+    """Result for a manual-form report from its fields and the analysis of its description.
+
+    The victim, suspect, location, date and weapon fields are taken as given
+    and come before anything the description suggests. Classification and
+    severity are scored over the whole form, which costs one keyword scan.
+    A form without a description gets an extractive summary of its fields,
+    which never goes through spaCy. timings asks for a timings block even
+    then.
+    """
+    from resultCache import content_key
+    from stageTimer import StageTimer
+    
+    timed = TIMINGS or timings or (description_result is not None and "timings" in description_result)
+    timer = StageTimer() if timed else NULL_TIMER
+    fields = form_fields(fields)
+    if description_result is not None:
+        entities = {key: dict(value) if key == "ages" else list(value)
+                    for key, value in description_result["entities"].items()}
+        summary, headline = description_result["summary"], description_result["headline"]
+    else:
+        entities = {key: [] for key in ["persons", "locations", "dates", "weapons", "actions",
+                                        "victims", "suspects", "officers"]}
+        entities["ages"] = {}
+        summary = headline = ""
+    
+    def put_first(category, value):
+        if value in entities[category]:
+            entities[category].remove(value)
+        entities[category].insert(0, value)
+    
+    with timer.stage("form"):
+        for name, category in [("location", "locations"), ("date", "dates"), ("weapon", "weapons")]:
+            if fields[name]:
+                put_first(category, fields[name])
+        # A stated victim or suspect holds that role only
+        for name, role, others in [("victim", "victims", ["suspects", "officers"]),
+                                   ("suspect", "suspects", ["victims", "officers"])]:
+            person = fields[name]
+            if person:
+                put_first(role, person)
+                if person not in entities["persons"]:
+                    entities["persons"].append(person)
+                for other in others:
+                    if person in entities[other]:
+                        entities[other].remove(person)
+        
+        # Score the form as the single text the backend used to send
+        text = "\n".join(f"{label}: {fields[name]}" for name, label in FORM_FIELDS)
+        hits = scan_keywords(text)
+        crime_type, confidence = classify_crime(text, entities, hits)
+        severity = calculate_severity(text, crime_type, entities, hits)
+    
+    info = None
+    if description_result is not None and "summarizer" in description_result:
+        info = {"summarizer": description_result["summarizer"], "elapsed_ms": description_result["summaryTimeMs"]}
+    filled = [f"{label}: {fields[name]}." for name, label in FORM_FIELDS if fields[name]]
+    if description_result is None and filled:
+        import time
+        start = time.perf_counter()
+        with timer.stage("summary"):
+            # One sentence per filled-in field, passed as the sentence list so nothing is parsed
+            summary = headline = extractive_fallback(" ".join(filled), filled)
+        info = {"summarizer": "extractive", "elapsed_ms": round((time.perf_counter() - start) * 1000, 1)}
+    
+    result = build_result(entities, crime_type, confidence, severity, summary, headline, info)
+    result["reportKey"] = content_key(json.dumps(fields, sort_keys=True))
+    
+    # The description's own timings, plus the form stage
+    if timed and description_result is not None and "timings" in description_result:
+        timings = description_result["timings"]
+        result["timings"] = dict(timings, stages=dict(timings["stages"], **timer.report()["stages"]))
+    elif timed:
+        result["timings"] = timer.report()
+    return result
+
+def process_form(fields, deadline=None, timings=False):
+    """Analyze a manual-form report field by field.
+
+    Only the free-text description goes through spaCy and T5, as a report of
+    its own, so its analysis and summary are cached under the description
+    text alone and an edit to any other field reuses them. A bare description
+    is not a whole report, so it skips the near-duplicate index.
+    """
+    description = form_fields(fields)["description"]
+    description_result = process_text(description, deadline, timings, None, False) if description else None
+    return assemble_form(fields, description_result, timings)
+
+def rescore_reports(keys=None, chunk_size=1024):
+    """Re-score saved Docs under the current rules, keeping their summaries.
+
+    Only entity post-processing, classification and severity run again; the
+    spaCy pipeline and T5 do not, and classification and severity are scored
+    a chunk of reports at a time. Yields each updated result, which also
+    replaces the cached one.
+    """
+    store = load_doc_store()
+    if store is None:
+        raise RuntimeError("Doc store is disabled; set CRIMECARD_DOC_STORE")
+    vocab = load_spacy().vocab
+    cache = load_result_cache()
+    duplicates = load_duplicate_index()
+    
+    keys = keys or store.keys()
+    for start in range(0, len(keys), chunk_size):
+        saved = []
+        for key in keys[start:start + chunk_size]:
+            item = store.get(key, vocab)
+            if item is None:
+                print(f"No saved Doc for {key}", file=sys.stderr)
+                continue
+            saved.append((key, *item))
+        
+        hits_list = [scan_keywords(doc.text) for _, doc, _ in saved]
+        entities_list = [extract_entities(doc.text, doc, hits) for (_, doc, _), hits in zip(saved, hits_list)]
+        scores = score_reports(None, entities_list, hits_list)
+        
+        for (key, doc, summary), entities, score in zip(saved, entities_list, scores):
+            result = build_result(entities, *score, summary["summary"], summary["headline"], summary)
+            result["reportKey"] = key
+            if cache is not None:
+                cache.put("process", key, result)
+            if duplicates is not None:
+                duplicates.add(key, duplicates.signature(doc.text), result)
+            yield result
+
+def iter_text(file_path, **limits):
+    """Stream the text of a PDF, DOCX or plain text file in chunks (pages, for PDFs)"""
+    if file_path.endswith('.pdf'):
+        chunks = lambda: extract_pdf_pages(file_path, **limits)
+    elif file_path.endswith('.docx'):
+        chunks = lambda: iter([extract_text_from_docx(file_path)])
+    else:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            yield f.read()
+        return
+    
+    # Documents are cached by content, so re-uploads of the same file are free
+    cache = load_result_cache()
+    if cache is None:
+        yield from chunks()
+        return
+    
+    # Truncated extractions are cached separately from full ones
+    budget = {
+        "max_pages": PDF_MAX_PAGES if limits.get("max_pages") is None else limits["max_pages"],
+        "max_bytes": PDF_MAX_BYTES if limits.get("max_bytes") is None else limits["max_bytes"]
+    }
+    from resultCache import content_key
+    with open(file_path, 'rb') as f:
+        key = content_key(os.path.splitext(file_path)[1], json.dumps(budget, sort_keys=True), f.read())
+    text = cache.get("extract", key)
+    if text is not None:
+        yield text
+        return
+    
+    parts = []
+    for chunk in chunks():
+        parts.append(chunk)
+        yield chunk
+    cache.put("extract", key, "\n".join(parts))
+
+def extract_text(file_path, **limits):
+    """Extract text from a PDF, DOCX or plain text file"""
+    return "\n".join(iter_text(file_path, **limits))
+
+def request_deadline(request):
+    """Monotonic deadline for a request's optional deadline_ms latency budget"""
+    import time
+    deadline_ms = request.get("deadline_ms")
+    if deadline_ms is None:
+        return None
+    return time.monotonic() + float(deadline_ms) / 1000.0
+
+def process_requests(items):
+    """Batch function for serve: items are (text, deadline, timings, on_analysis, dedup) tuples"""
+    texts, deadlines, timings, on_analysis, dedup = zip(*items)
+    return process_texts(list(texts), list(deadlines), list(timings), list(on_analysis), list(dedup))
+
+# Largest request line serve accepts; longer lines are skipped without being buffered whole
+MAX_REQUEST_BYTES = int(os.environ.get("NLP_MAX_REQUEST_BYTES", 16 * 1024 * 1024))
+
+class OversizedRequest(ValueError):
+    pass
+
+def read_requests(stream, max_bytes=MAX_REQUEST_BYTES):
+    """Parsed requests from a binary stream of newline-delimited JSON.
+
+    Yields OversizedRequest instead of a request for a line longer than
+    max_bytes, with its id when it can be read from the start of the line.
+    """
+    while True:
+        line = stream.readline(max_bytes + 1)
+        if not line:
+            return
+        if len(line) > max_bytes and not line.endswith(b"\n"):
+            head = line[:256]
+            # Drain the rest of the oversized line in bounded pieces
+            while line and not line.endswith(b"\n"):
+                line = stream.readline(max_bytes + 1)
+            match = re.match(rb'\s*\{\s*"id"\s*:\s*(\d+|"[^"]*")', head)
+            error = OversizedRequest(f"Request exceeds {max_bytes} bytes")
+            error.request_id = json.loads(match.group(1)) if match else None
+            yield error
+            continue
+        line = line.strip()
+        if line:
+            yield line
+
+PROFILE_DIR = os.environ.get("CRIMECARD_PROFILE_DIR", os.path.join(CACHE_DIR, "profiles"))
+
+def run_profiled(path, func, *args, **kwargs):
+    """Run func under cProfile and dump the stats to path (read them with pstats or snakeviz)"""
+    import cProfile
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args, **kwargs)
+    finally:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        profiler.dump_stats(path)
+
+def handle_request(request, batcher=None, on_analysis=None):
+    """Run a single worker request and return its result payload"""
+    command = request.get("command")
+    if command == "process":
+        args = (request.get("text", ""), request_deadline(request), bool(request.get("timings")), on_analysis)
+        if request.get("profile"):
+            import time
+            path = os.path.join(PROFILE_DIR, f"process-{int(time.time() * 1000)}-{request.get('id')}.prof")
+            return dict(run_profiled(path, process_text, *args), profile=path)
+        return process_text(*args)
+    elif command == "process_form":
+        return process_form(request.get("fields") or {}, request_deadline(request), bool(request.get("timings")))
+    elif command == "stats":
+        cache = load_result_cache()
+        duplicates = load_duplicate_index()
+        return {
+            "batching": batcher.stats() if batcher else None,
+            "cache": cache.stats() if cache else None,
+            "duplicates": duplicates.stats() if duplicates else None
+        }
+    elif command == "extract":
+        return {"text": extract_text(request["path"])}
+    elif command == "ping":
+        return {"status": "ready"}
+    raise ValueError(f"Unknown command: {command}")
+
+def serve(batch_size=8, batch_window_ms=20, max_request_bytes=MAX_REQUEST_BYTES):
+    """Long-lived worker: newline-delimited JSON requests on stdin, responses on stdout.
+
+    Each request looks like {"id": ..., "command": "process", "text": ...},
+    {"id": ..., "command": "process_form", "fields": {...}} or
+    {"id": ..., "command": "extract", "path": ...}. Every response echoes the
+    request id so the caller can correlate out-of-order replies.
+
+    `process` requests that arrive within batch_window_ms of each other are
+    run together, up to batch_size at a time; `stats` reports queue metrics.
+    A `process` request may carry "deadline_ms", a latency budget counted from
+    when the request is read, "timings": true for a per-stage timings block,
+    and "profile": true to run it unbatched under cProfile. With "stream": true,
+    a {"id": ..., "stage": "analysis", "partial": {...}} message carrying the
+    entities, classification and severity is sent before the final response.
+    Request lines longer than max_request_bytes are rejected.
+    """
+    from batchScheduler import MicroBatcher
+
+    # Keep stray prints from libraries off the protocol stream
+    out = sys.stdout
+    sys.stdout = sys.stderr
+    out_lock = threading.Lock()
+
+    def respond(payload):
+        with out_lock:
+            out.write(json.dumps(payload) + "\n")
+            out.flush()
+
+    try:
+        load_models()
+    except Exception as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
+
+    batcher = MicroBatcher(process_requests, max_batch_size=batch_size, window_ms=batch_window_ms)
+
+    def reply_to(request_id):
+        def callback(result, error):
+            if error is None:
+                respond({"id": request_id, "ok": True, "result": result})
+            else:
+                respond({"id": request_id, "ok": False, "error": str(error)})
+        return callback
+
+    def form_reply_to(request_id, fields):
+        reply = reply_to(request_id)
+        def callback(result, error):
+            if error is None:
+                try:
+                    result = assemble_form(fields, result)
+                except Exception as e:
+                    result, error = None, e
+            reply(result, error)
+        return callback
+    
+    def partial_to(request_id):
+        def callback(partial):
+            respond({"id": request_id, "stage": "analysis", "partial": partial})
+        return callback
+
+    respond({"id": None, "ok": True, "result": {"status": "ready", "max_request_bytes": max_request_bytes}})
+
+    for line in read_requests(sys.stdin.buffer, max_request_bytes):
+        if isinstance(line, OversizedRequest):
+            respond({"id": line.request_id, "ok": False, "error": str(line)})
+            continue
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            on_analysis = partial_to(request_id) if request.get("stream") else None
+            if request.get("command") == "process" and not request.get("profile"):
+                item = (request.get("text", ""), request_deadline(request), bool(request.get("timings")), on_analysis, True)
+                batcher.submit(item, reply_to(request_id))
+                continue
+            if request.get("command") == "process_form":
+                # The description is batched like any report; the fields are merged in afterwards
+                fields = request.get("fields") or {}
+                description = form_fields(fields)["description"]
+                if description:
+                    item = (description, request_deadline(request), bool(request.get("timings")), None, False)
+                    batcher.submit(item, form_reply_to(request_id, fields))
+                    continue
+            result = handle_request(request, batcher, on_analysis)
+            respond({"id": request_id, "ok": True, "result": result})
+        except Exception as e:
+            respond({"id": request_id, "ok": False, "error": str(e)})
+
+    # Finish queued reports before exiting
+    batcher.close()
+
+BATCH_EXTENSIONS = ('.pdf', '.docx', '.txt')
+
+def list_batch_files(source):
+    """Report files from a directory (searched recursively) or a manifest with one path per line"""
+    if os.path.isdir(source):
+        paths = []
+        for root, _, files in os.walk(source):
+            paths.extend(os.path.join(root, name) for name in files if name.lower().endswith(BATCH_EXTENSIONS))
+        return sorted(paths)
+    
+    base_dir = os.path.dirname(os.path.abspath(source))
+    paths = []
+    with open(source, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                paths.append(line if os.path.isabs(line) else os.path.join(base_dir, line))
+    return paths
+
+def process_files(paths):
+    """Extract and analyze a chunk of files; failures are reported per file"""
+    texts, outcomes = [], {}
+    for path in paths:
+        try:
+            texts.append((path, extract_text(path)))
+        except Exception as e:
+            outcomes[path] = {"file": path, "ok": False, "error": f"Error: {str(e)}"}
+    
+    if texts:
+        try:
+            results = process_texts([text for _, text in texts])
+            for (path, _), result in zip(texts, results):
+                outcomes[path] = {"file": path, "ok": True, "result": result}
+        except Exception:
+            # Retry one at a time so one bad report does not fail the whole chunk
+            for path, text in texts:
+                try:
+                    outcomes[path] = {"file": path, "ok": True, "result": process_text(text)}
+                except Exception as e:
+                    outcomes[path] = {"file": path, "ok": False, "error": f"Processing error: {str(e)}"}
+    
+    return [outcomes[path] for path in paths]
+
+def init_batch_worker():
+    """Runs in each forked worker: reopen per-process resources"""
+    global result_cache, duplicate_index, doc_store
+    # A SQLite connection must not be shared across fork
+    result_cache = None
+    duplicate_index = None
+    doc_store = None
+
+def run_batch(source, output=None, checkpoint=None, workers=None, chunk_size=4, preload_summarizer=True):
+    """Analyze every report in a directory or manifest across a pool of forked workers.
+
+    Models are loaded once in the parent and shared copy-on-write with the
+    workers. Each result is written as one NDJSON line as soon as its chunk
+    finishes, and completed files are appended to the checkpoint file so an
+    interrupted run picks up where it left off.
+    """
+    import gc
+    import multiprocessing
+    import time
+    
+    paths = list_batch_files(source)
+    checkpoint = checkpoint or (output + ".checkpoint" if output else None)
+    done = set()
+    if checkpoint and os.path.exists(checkpoint):
+        with open(checkpoint, 'r', encoding='utf-8') as f:
+            done = set(line.rstrip('\n') for line in f if line.strip())
+    todo = [path for path in paths if path not in done]
+    print(f"Batch: {len(paths)} files, {len(paths) - len(todo)} already done, {len(todo)} to process",
+          file=sys.stderr)
+    if not todo:
+        return
+    
+    load_spacy()
+    load_rule_engine()
+    load_keyword_index()
+    if preload_summarizer:
+        load_summarizer()
+    # Keep the shared model objects out of the collector so workers do not dirty their pages
+    gc.freeze()
+    
+    workers = workers or os.cpu_count() or 1
+    chunks = [todo[i:i + chunk_size] for i in range(0, len(todo), chunk_size)]
+    out = open(output, 'a', encoding='utf-8') if output else sys.stdout
+    progress = open(checkpoint, 'a', encoding='utf-8') if checkpoint else None
+    start = time.perf_counter()
+    processed = failed = 0
+    
+    try:
+        context = multiprocessing.get_context("fork")
+        with context.Pool(workers, initializer=init_batch_worker) as pool:
+            for outcomes in pool.imap_unordered(process_files, chunks):
+                for outcome in outcomes:
+                    out.write(json.dumps(outcome) + "\n")
+                    processed += 1
+                    failed += 0 if outcome["ok"] else 1
+                out.flush()
+                if progress:
+                    progress.writelines(outcome["file"] + "\n" for outcome in outcomes)
+                    progress.flush()
+    finally:
+        if output:
+            out.close()
+        if progress:
+            progress.close()
+    
+    elapsed = time.perf_counter() - start
+    print(f"Batch: {processed} files ({failed} failed) in {elapsed:.1f}s with {workers} workers, "
+          f"{processed / elapsed if elapsed else 0:.2f} reports/s", file=sys.stderr)
+
+def parse_batch_args(args):
+    import argparse
+    parser = argparse.ArgumentParser(prog="nlpService.py batch")
+    parser.add_argument("source", help="directory of .pdf/.docx/.txt reports, or a manifest file listing them")
+    parser.add_argument("--output", help="NDJSON file to append results to (default: stdout)")
+    parser.add_argument("--checkpoint", help="file of completed paths (default: <output>.checkpoint)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=4, help="files per worker task")
+    parser.add_argument("--no-preload-summarizer", action="store_true",
+                        help="load T5 in each worker instead of the parent")
+    return parser.parse_args(args)
+
+def parse_extract_args(args):
+    import argparse
+    parser = argparse.ArgumentParser(prog="nlpService.py extract")
+    parser.add_argument("file")
+    parser.add_argument("--max-pages", type=int, default=None, help="stop after this many PDF pages")
+    parser.add_argument("--max-bytes", type=int, default=None, help="stop after this much PDF text")
+    parser.add_argument("--workers", type=int, default=None, help="processes for page-parallel PDF extraction")
+    return parser.parse_args(args)
+
+def parse_entities_args(args):
+    import argparse
+    parser = argparse.ArgumentParser(prog="nlpService.py entities")
+    parser.add_argument("file", help="PDF, DOCX or plain text document")
+    parser.add_argument("--window-chars", type=int, default=STREAM_WINDOW_CHARS, help="characters per window")
+    parser.add_argument("--overlap-sentences", type=int, default=STREAM_OVERLAP_SENTENCES,
+                        help="sentences each window repeats from the one before")
+    parser.add_argument("--max-pages", type=int, default=None, help="stop after this many PDF pages")
+    return parser.parse_args(args)
+
+def parse_process_args(args):
+    import argparse
+    parser = argparse.ArgumentParser(prog="nlpService.py process")
+    parser.add_argument("text", nargs="?", help="report text (default: read stdin)")
+    parser.add_argument("--timings", action="store_true", help="add per-stage wall and CPU times to the result")
+    parser.add_argument("--profile", metavar="FILE", help="run under cProfile and write the stats to FILE")
+    return parser.parse_args(args)
+
+def parse_rescore_args(args):
+    import argparse
+    parser = argparse.ArgumentParser(prog="nlpService.py rescore")
+    parser.add_argument("keys", nargs="*", help="report keys to re-score (default: every saved Doc)")
+    parser.add_argument("--output", help="NDJSON file to write results to (default: stdout)")
+    return parser.parse_args(args)
+
+def parse_serve_args(args):
+    """Batching knobs and request size limit for `serve`, from flags or NLP_BATCH_SIZE / NLP_BATCH_WINDOW_MS / NLP_MAX_REQUEST_BYTES"""
+    import argparse
+    parser = argparse.ArgumentParser(prog="nlpService.py serve")
+    parser.add_argument("--batch-size", type=int, default=int(os.environ.get("NLP_BATCH_SIZE", 8)))
+    parser.add_argument("--batch-window-ms", type=float, default=float(os.environ.get("NLP_BATCH_WINDOW_MS", 20)))
+    parser.add_argument("--max-request-bytes", type=int, default=MAX_REQUEST_BYTES)
+    return parser.parse_args(args)
+
+def parse_http_args(args):
+    """Options for `http`, from flags or NLP_HTTP_* / NLP_BATCH_* / NLP_WORKER_* environment variables"""
+    import argparse
+    parser = argparse.ArgumentParser(prog="nlpService.py http")
+    parser.add_argument("--host", default=os.environ.get("NLP_HTTP_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("NLP_HTTP_PORT", 8765)))
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("NLP_HTTP_WORKERS", 1)),
+                        help="forked worker processes; 1 runs reports through the in-process batcher")
+    parser.add_argument("--max-requests-per-worker", type=int,
+                        default=int(os.environ.get("NLP_WORKER_MAX_REQUESTS", 0)),
+                        help="replace a worker after this many requests (0: never)")
+    parser.add_argument("--max-worker-rss-mb", type=float, default=float(os.environ.get("NLP_WORKER_MAX_RSS_MB", 0)),
+                        help="replace a worker once its RSS, shared model pages included, passes this (0: never)")
+    parser.add_argument("--max-pending", type=int, default=int(os.environ.get("NLP_HTTP_MAX_PENDING", 64)),
+                        help="reports admitted at once before answering 429")
+    parser.add_argument("--drain-seconds", type=float, default=float(os.environ.get("NLP_HTTP_DRAIN_SECONDS", 30)))
+    parser.add_argument("--batch-size", type=int, default=int(os.environ.get("NLP_BATCH_SIZE", 8)))
+    parser.add_argument("--batch-window-ms", type=float, default=float(os.environ.get("NLP_BATCH_WINDOW_MS", 20)))
+    parser.add_argument("--max-request-bytes", type=int, default=MAX_REQUEST_BYTES)
+    return parser.parse_args(args)
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python nlpService.py <command> [args]")
@@ -629,28 +2098,103 @@ if __name__ == "__main__":
     command = sys.argv[1]
     
     if command == "extract":
-        file_path = sys.argv[2]
+        options = parse_extract_args(sys.argv[2:])
         try:
-            if file_path.endswith('.pdf'):
-                print(extract_text_from_pdf(file_path))
-            elif file_path.endswith('.docx'):
-                print(extract_text_from_docx(file_path))
-            else:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    print(f.read())
+            # Print each page as soon as it is extracted so the caller can start reading
+            for chunk in iter_text(options.file, max_pages=options.max_pages,
+                                   max_bytes=options.max_bytes, workers=options.workers):
+                print(chunk, flush=True)
         except Exception as e:
             print(f"Error: {str(e)}", file=sys.stderr)
             sys.exit(1)
     
+    elif command == "entities":
+        options = parse_entities_args(sys.argv[2:])
+        try:
+            # Pages go through the pipeline as they are extracted; no Doc spans the whole document
+            entities, stats = extract_entities_streaming(iter_text(options.file, max_pages=options.max_pages),
+                                                         window_chars=options.window_chars,
+                                                         overlap_sentences=options.overlap_sentences)
+            print(json.dumps({"entities": entities, "windows": stats["windows"], "chars": stats["chars"],
+                              "peakRssMb": stats["peak_rss_mb"]}, indent=2))
+        except Exception as e:
+            print(f"Processing error: {str(e)}", file=sys.stderr)
+            sys.exit(1)
+    
     elif command == "process":
-        text = sys.argv[2] if len(sys.argv) > 2 else sys.stdin.read()
+        options = parse_process_args(sys.argv[2:])
+        text = options.text if options.text is not None else sys.stdin.read()
         try:
-            result = process_text(text)
+            if options.profile:
+                result = run_profiled(options.profile, process_text, text, timings=options.timings)
+            else:
+                result = process_text(text, timings=options.timings)
             print(json.dumps(result, indent=2))
         except Exception as e:
             print(f"Processing error: {str(e)}", file=sys.stderr)
             sys.exit(1)
     
+    elif command == "batch":
+        options = parse_batch_args(sys.argv[2:])
+        try:
+            run_batch(options.source, output=options.output, checkpoint=options.checkpoint,
+                      workers=options.workers, chunk_size=options.chunk_size,
+                      preload_summarizer=not options.no_preload_summarizer)
+        except Exception as e:
+            print(f"Batch error: {str(e)}", file=sys.stderr)
+            sys.exit(1)
+    
+    elif command == "rescore":
+        import time
+        options = parse_rescore_args(sys.argv[2:])
+        out = open(options.output, 'w', encoding='utf-8') if options.output else sys.stdout
+        start = time.perf_counter()
+        count = 0
+        try:
+            for result in rescore_reports(options.keys):
+                out.write(json.dumps(result) + "\n")
+                count += 1
+        except Exception as e:
+            print(f"Rescore error: {str(e)}", file=sys.stderr)
+            sys.exit(1)
+        finally:
+            if options.output:
+                out.close()
+        print(f"Rescore: {count} reports in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    
+    elif command == "cache":
+        action = sys.argv[2] if len(sys.argv) > 2 else "stats"
+        cache = load_result_cache()
+        if cache is None:
+            print("Result cache is disabled", file=sys.stderr)
+            sys.exit(1)
+        duplicates = load_duplicate_index()
+        store = load_doc_store()
+        if action == "clear":
+            cache.clear()
+            if duplicates is not None:
+                duplicates.clear()
+            if store is not None:
+                store.clear()
+        stats = cache.stats()
+        stats["duplicates"] = duplicates.stats() if duplicates else None
+        stats["docs"] = store.stats() if store else None
+        print(json.dumps(stats, indent=2))
+    
+    elif command == "serve":
+        options = parse_serve_args(sys.argv[2:])
+        serve(batch_size=options.batch_size, batch_window_ms=options.batch_window_ms,
+              max_request_bytes=options.max_request_bytes)
+    
+    elif command == "http":
+        from httpService import run_server
+        options = parse_http_args(sys.argv[2:])
+        run_server(sys.modules[__name__], host=options.host, port=options.port, workers=options.workers,
+                   max_pending=options.max_pending, batch_size=options.batch_size,
+                   batch_window_ms=options.batch_window_ms, max_request_bytes=options.max_request_bytes,
+                   drain_seconds=options.drain_seconds, max_requests_per_worker=options.max_requests_per_worker,
+                   max_worker_rss_mb=options.max_worker_rss_mb)
+    
     else:
         print(f"Unknown command: {command}", file=sys.stderr)
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
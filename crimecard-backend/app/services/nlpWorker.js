@@ -0,0 +1,149 @@
+//crimecard-backend\app\services\nlpWorker.js
+const path = require('path');
+const readline = require('readline');
+const { spawn } = require('child_process');
+
+const SCRIPT_PATH = path.join(__dirname, 'nlpService.py');
+const PYTHON_PATH = process.env.PYTHON_PATH || 'python';
+// Must not exceed the worker's own limit (also read from NLP_MAX_REQUEST_BYTES)
+const MAX_REQUEST_BYTES = Number(process.env.NLP_MAX_REQUEST_BYTES) || 16 * 1024 * 1024;
+// A worker that exits before saying anything is restarted after a growing delay
+const RESPAWN_BASE_MS = 1000;
+const RESPAWN_MAX_MS = 60 * 1000;
+
+// Long-lived nlpService.py worker. Models are loaded once when the process
+// starts and requests are exchanged as newline-delimited JSON, correlated by id.
+// A request may receive partial "stage" messages before its final response.
+class NLPWorker {
+  constructor() {
+    this.child = null;
+    this.pending = new Map();
+    this.nextId = 1;
+    this.failures = 0;
+    this.retryAt = 0;
+  }
+
+  start() {
+    if (this.child) return;
+
+    const pyProcess = spawn(PYTHON_PATH, ['-u', SCRIPT_PATH, 'serve']);
+    this.child = pyProcess;
+    let started = false;
+
+    readline.createInterface({ input: pyProcess.stdout }).on('line', (line) => {
+      // Any output, starting with the ready message, means the worker came up
+      started = true;
+      this.failures = 0;
+      let message;
+      try {
+        message = JSON.parse(line);
+      } catch (err) {
+        console.error('NLP worker - Unparseable output:', line);
+        return;
+      }
+
+      const request = this.pending.get(message.id);
+      if (!request) return;
+
+      if (message.stage) {
+        if (request.onPartial) request.onPartial(message.stage, message.partial);
+        return;
+      }
+      this.pending.delete(message.id);
+
+      if (message.ok) {
+        request.resolve(message.result);
+      } else {
+        request.reject(new Error(`NLP processing failed: ${message.error}`));
+      }
+    });
+
+    pyProcess.stderr.on('data', (data) => {
+      console.log('NLP worker - Error Output:', data.toString());
+    });
+
+    const onExit = (err) => {
+      if (this.child !== pyProcess) return;
+      this.child = null;
+      if (!started) {
+        this.failures += 1;
+        const delay = Math.min(RESPAWN_MAX_MS, RESPAWN_BASE_MS * 2 ** (this.failures - 1));
+        this.retryAt = Date.now() + delay;
+        console.error(`NLP worker - Failed to start, next attempt in ${delay} ms`);
+      }
+      const reason = err ? err.message : 'NLP worker exited';
+      for (const request of this.pending.values()) {
+        request.reject(new Error(`NLP processing failed: ${reason}`));
+      }
+      this.pending.clear();
+    };
+
+    pyProcess.on('error', onExit);
+    // Writing to a worker that has already exited fails with EPIPE
+    pyProcess.stdin.on('error', (err) => {
+      onExit(err);
+      pyProcess.kill();
+    });
+    pyProcess.on('close', (code) => {
+      console.log('NLP worker - Exit code:', code);
+      onExit();
+    });
+  }
+
+  request(command, payload = {}, onPartial = null) {
+    if (!this.child && Date.now() < this.retryAt) {
+      const seconds = Math.ceil((this.retryAt - Date.now()) / 1000);
+      return Promise.reject(new Error(`NLP processing failed: worker unavailable, retrying in ${seconds}s`));
+    }
+    this.start();
+
+    return new Promise((resolve, reject) => {
+      const id = this.nextId++;
+      const line = JSON.stringify({ id, command, ...payload }) + '\n';
+      if (Buffer.byteLength(line) > MAX_REQUEST_BYTES) {
+        reject(new Error(`NLP processing failed: request exceeds ${MAX_REQUEST_BYTES} bytes`));
+        return;
+      }
+      this.pending.set(id, { resolve, reject, onPartial });
+      this.child.stdin.write(line);
+    });
+  }
+
+  // options.deadlineMs: latency budget after which the summary falls back to extractive
+  // options.timings: ask for a per-stage timings block in the result
+  // options.onPartial(stage, partial): called with entities, classification and
+  // severity before the summary is ready
+  process(text, options = {}) {
+    const payload = { text };
+    if (options.deadlineMs) {
+      payload.deadline_ms = options.deadlineMs;
+    }
+    if (options.timings) {
+      payload.timings = true;
+    }
+    if (options.onPartial) {
+      payload.stream = true;
+    }
+    return this.request('process', payload, options.onPartial || null);
+  }
+
+  // Manual-form fields ({crimeType, victim, suspect, location, date, weapon, description}).
+  // Only the description goes through the models, and it is cached on its own, so
+  // editing any other field does not re-parse or re-summarize it.
+  processForm(fields, options = {}) {
+    const payload = { fields };
+    if (options.deadlineMs) {
+      payload.deadline_ms = options.deadlineMs;
+    }
+    if (options.timings) {
+      payload.timings = true;
+    }
+    return this.request('process_form', payload);
+  }
+
+  extract(filePath) {
+    return this.request('extract', { path: filePath }).then((result) => result.text);
+  }
+}
+
+module.exports = new NLPWorker();
@@ -0,0 +1,114 @@
+#crimecard-backend\app\services\resultCache.py
+"""Content-addressed on-disk result cache.
+
+Entries are keyed by a hash of their input plus a version fingerprint, stored
+in a single SQLite file and evicted least-recently-used once the cache grows
+past its size limit. When the fingerprint changes, every entry written under
+the old one is dropped.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+def content_key(*parts):
+    """Stable hash of text or bytes parts"""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode("utf-8")
+        digest.update(hashlib.sha256(part).digest())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Size-bounded LRU cache of JSON-serializable results"""
+
+    def __init__(self, path, fingerprint, max_bytes=256 * 1024 * 1024):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "namespace TEXT, key TEXT, value TEXT, size INTEGER, last_access REAL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS stats (namespace TEXT PRIMARY KEY, hits INTEGER, misses INTEGER)"
+            )
+
+            row = self._db.execute("SELECT value FROM meta WHERE name = 'fingerprint'").fetchone()
+            if row is None or row[0] != fingerprint:
+                # Models, rules or code changed: everything cached so far is stale
+                self._db.execute("DELETE FROM entries")
+                self._db.execute("DELETE FROM stats")
+                self._db.execute("INSERT OR REPLACE INTO meta VALUES ('fingerprint', ?)", (fingerprint,))
+
+    def get(self, namespace, key):
+        """Cached value, or None on a miss"""
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT value FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            if row is not None:
+                self._db.execute(
+                    "UPDATE entries SET last_access = ? WHERE namespace = ? AND key = ?",
+                    (time.time(), namespace, key)
+                )
+            self._count(namespace, hit=row is not None)
+        return json.loads(row[0]) if row is not None else None
+
+    def put(self, namespace, key, value):
+        data = json.dumps(value)
+        size = len(data.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, data, size, time.time())
+            )
+            self._evict()
+
+    def stats(self):
+        """Hit and miss counts per namespace, plus current size"""
+        with self._lock:
+            rows = self._db.execute("SELECT namespace, hits, misses FROM stats").fetchall()
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        namespaces = {}
+        for namespace, hits, misses in rows:
+            total = hits + misses
+            namespaces[namespace] = {"hits": hits, "misses": misses, "hit_rate": hits / total if total else 0.0}
+        return {"entries": entries, "bytes": size, "max_bytes": self.max_bytes, "namespaces": namespaces}
+
+    def clear(self):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM entries")
+            self._db.execute("DELETE FROM stats")
+
+    def _count(self, namespace, hit):
+        self._db.execute("INSERT OR IGNORE INTO stats VALUES (?, 0, 0)", (namespace,))
+        column = "hits" if hit else "misses"
+        self._db.execute(f"UPDATE stats SET {column} = {column} + 1 WHERE namespace = ?", (namespace,))
+
+    def _evict(self):
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for namespace, key, size in self._db.execute(
+            "SELECT namespace, key, size FROM entries ORDER BY last_access"
+        ).fetchall():
+            self._db.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+            total -= size
+            if total <= self.max_bytes:
+                break
@@ -0,0 +1,114 @@
+#crimecard-backend\app\services\summarizerBackends.py
+"""Interchangeable T5 inference engines for CPU summarization.
+
+Every backend exposes the same small surface: a Hugging Face `tokenizer`, the
+`tensor_type` its model takes ("tf", "pt" or "np"), and `generate(**kwargs)`
+returning the generated token ids as a NumPy array. The eager TensorFlow model
+is the reference; the others trade some start-up work for lower latency.
+"""
+import os
+
+
+class TFBackend:
+    """Eager TFT5ForConditionalGeneration with the SentencePiece tokenizer (the reference path)"""
+
+    name = "tf"
+    tensor_type = "tf"
+
+    def __init__(self, model_name, cache_dir=None):
+        from transformers import TFT5ForConditionalGeneration, T5Tokenizer
+        self.tokenizer = T5Tokenizer.from_pretrained(model_name)
+        self.model = TFT5ForConditionalGeneration.from_pretrained(model_name)
+
+    def generate(self, **kwargs):
+        return self.model.generate(**kwargs).numpy()
+
+
+class TFXLABackend:
+    """The same TF weights with generate compiled by XLA, and the Rust tokenizer.
+
+    XLA compiles once per input shape and decoding settings, so inputs are
+    padded to a multiple of pad_to tokens to keep the number of compiled
+    variants small.
+    """
+
+    name = "tf-xla"
+    tensor_type = "tf"
+
+    def __init__(self, model_name, cache_dir=None, pad_to=64):
+        import tensorflow as tf
+        from transformers import TFT5ForConditionalGeneration, T5TokenizerFast
+        self.tokenizer = T5TokenizerFast.from_pretrained(model_name)
+        self.model = TFT5ForConditionalGeneration.from_pretrained(model_name)
+        self.pad_to = pad_to
+        self._generate = tf.function(self.model.generate, jit_compile=True)
+
+    def generate(self, **kwargs):
+        import tensorflow as tf
+        length = int(kwargs["input_ids"].shape[1])
+        padding = -length % self.pad_to
+        if padding:
+            # Padded positions are masked out, so the encoder output is unchanged
+            kwargs["input_ids"] = tf.pad(kwargs["input_ids"], [[0, 0], [0, padding]],
+                                         constant_values=self.tokenizer.pad_token_id)
+            kwargs["attention_mask"] = tf.pad(kwargs["attention_mask"], [[0, 0], [0, padding]])
+        return self._generate(**kwargs).numpy()
+
+
+class ONNXBackend:
+    """t5-small exported to ONNX Runtime, optionally with int8 dynamic quantization.
+
+    The export (and quantization) runs once and is kept under cache_dir.
+    """
+
+    tensor_type = "pt"
+    parts = ["encoder_model", "decoder_model", "decoder_with_past_model"]
+
+    def __init__(self, model_name, cache_dir, quantize=True):
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        from transformers import T5TokenizerFast
+
+        self.name = "onnx-int8" if quantize else "onnx"
+        self.tokenizer = T5TokenizerFast.from_pretrained(model_name)
+        export_dir = os.path.join(cache_dir, f"{model_name}-onnx")
+        if not all(os.path.exists(os.path.join(export_dir, f"{part}.onnx")) for part in self.parts):
+            ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True).save_pretrained(export_dir)
+
+        suffix = ""
+        if quantize:
+            suffix = "_quantized"
+            if not all(os.path.exists(os.path.join(export_dir, f"{part}{suffix}.onnx")) for part in self.parts):
+                self._quantize(export_dir)
+
+        self.model = ORTModelForSeq2SeqLM.from_pretrained(
+            export_dir,
+            encoder_file_name=f"encoder_model{suffix}.onnx",
+            decoder_file_name=f"decoder_model{suffix}.onnx",
+            decoder_with_past_file_name=f"decoder_with_past_model{suffix}.onnx"
+        )
+
+    def _quantize(self, export_dir):
+        from optimum.onnxruntime import ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        config = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+        for part in self.parts:
+            quantizer = ORTQuantizer.from_pretrained(export_dir, file_name=f"{part}.onnx")
+            quantizer.quantize(save_dir=export_dir, quantization_config=config)
+
+    def generate(self, **kwargs):
+        return self.model.generate(**kwargs).numpy()
+
+
+BACKENDS = {
+    "tf": TFBackend,
+    "tf-xla": TFXLABackend,
+    "onnx": lambda model_name, cache_dir: ONNXBackend(model_name, cache_dir, quantize=False),
+    "onnx-int8": lambda model_name, cache_dir: ONNXBackend(model_name, cache_dir, quantize=True)
+}
+
+
+def load_backend(name, model_name, cache_dir):
+    """Build the named summarizer backend"""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown summarizer backend: {name} (expected one of {', '.join(BACKENDS)})")
+    return BACKENDS[name](model_name, cache_dir)
@@ -0,0 +1,271 @@
+#crimecard-backend\app\services\workerPool.py
+"""Worker processes forked from a fork server that holds the loaded models.
+
+The pool first forks a fork server, a single-threaded process that does
+nothing but fork workers on request. Every worker, including each
+replacement for a recycled one, therefore starts from the same pages and
+shares whatever the caller loaded beforehand (spaCy and the compiled rules)
+copy-on-write. Forking a replacement from the threaded caller instead could
+deadlock. The caller must load only fork-safe state before starting the
+pool: libraries that start thread pools of their own, like TensorFlow, are
+loaded by the initializer in each worker instead. Workers connect back over
+a Unix socket once initialized and run service functions by name. A worker
+is replaced after max_requests requests, or once its RSS passes max_rss_mb.
+"""
+import itertools
+import os
+import queue
+import secrets
+import signal
+import sys
+import threading
+import time
+
+_STOP = object()
+
+
+def memory_stats(pid="self"):
+    """RSS, PSS and the shared/private split of a process in MB, from /proc/<pid>/smaps_rollup"""
+    fields = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                parts = value.split()
+                if len(parts) == 2 and parts[1] == "kB":
+                    fields[name] = int(parts[0]) / 1024
+    except OSError:
+        return {"rss_mb": round(rss_mb(pid), 1)}
+    return {
+        "rss_mb": round(fields.get("Rss", 0), 1),
+        "pss_mb": round(fields.get("Pss", 0), 1),
+        "shared_mb": round(fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0), 1),
+        "private_mb": round(fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0), 1)
+    }
+
+
+def rss_mb(pid="self"):
+    """Resident set size of a process in MB; cheap enough to read after every request"""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _fork_server(service, commands, address, authkey, initializer):
+    """Fork server loop: fork a worker for every spawn command until told to exit"""
+    # Workers are never waited for here; let the kernel reap them
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    # Shutdown is the caller's to run: workers finish their tasks and exit when their connection closes
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    while True:
+        try:
+            command = commands.recv()
+        except EOFError:
+            break
+        if command[0] == "exit":
+            break
+        if os.fork() == 0:
+            commands.close()
+            _worker(service, command[1], address, authkey, initializer)
+    commands.close()
+
+
+def _worker(service, worker_id, address, authkey, initializer):
+    """Worker loop: run tasks sent over the connection, then exit without returning to the fork server"""
+    from multiprocessing.connection import Client
+
+    code = 0
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    try:
+        service.init_batch_worker()
+        if initializer:
+            try:
+                getattr(service, initializer)()
+            except Exception as e:
+                # Keep serving; tasks that need what failed to load report it themselves
+                print(f"Worker {worker_id} initializer failed: {str(e)}", file=sys.stderr)
+        conn = Client(address, family="AF_UNIX", authkey=authkey)
+        conn.send(("hello", worker_id, os.getpid()))
+        while True:
+            message = conn.recv()
+            if message[0] == "stop":
+                break
+            _, name, args = message
+            try:
+                result = (True, getattr(service, name)(*args))
+            except Exception as e:
+                result = (False, str(e))
+            conn.send(result + (rss_mb(),))
+    except (EOFError, OSError):
+        pass
+    except Exception as e:
+        print(f"Worker {worker_id} failed: {str(e)}", file=sys.stderr)
+        code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+class WorkerError(RuntimeError):
+    """A task failed in a worker, or its worker exited mid-task"""
+
+
+class ForkServerPool:
+    """Recycling process pool with multiprocessing.Pool's apply_async/close/join surface.
+
+    initializer names a service function each worker runs before it takes tasks.
+    """
+
+    def __init__(self, service, workers, max_requests=0, max_rss_mb=0, initializer=None):
+        import multiprocessing
+        from multiprocessing.connection import Listener
+
+        self.service = service
+        self.workers = max(1, int(workers))
+        self.max_requests = max(0, int(max_requests or 0))
+        self.max_rss_mb = max(0.0, float(max_rss_mb or 0))
+
+        self._tasks = queue.Queue()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._live = {}  # worker id -> {"pid", "requests", "started"}
+        self._threads = []
+        self._closing = False
+        self._counters = {"spawned": 0, "recycled_requests": 0, "recycled_rss": 0, "crashed": 0,
+                          "tasks": 0, "failed": 0}
+
+        authkey = secrets.token_bytes(32)
+        self._listener = Listener(family="AF_UNIX", authkey=authkey)
+        context = multiprocessing.get_context("fork")
+        self._commands, server_end = context.Pipe()
+        self._server = context.Process(target=_fork_server,
+                                       args=(service, server_end, self._listener.address, authkey, initializer),
+                                       daemon=True)
+        self._server.start()
+        server_end.close()
+
+        self._acceptor = threading.Thread(target=self._accept, daemon=True)
+        self._acceptor.start()
+        for _ in range(self.workers):
+            self._spawn()
+
+    def apply_async(self, func, args=(), callback=None, error_callback=None):
+        """Run service function func(*args) in a worker; exactly one of the callbacks gets its outcome"""
+        if self._closing:
+            raise ValueError("Pool is closed")
+        self._tasks.put((func.__name__, tuple(args), callback, error_callback))
+
+    def stats(self):
+        """Per-worker requests and memory, plus the fork server's, and recycling counters"""
+        with self._lock:
+            live = {worker_id: dict(worker) for worker_id, worker in self._live.items()}
+            counters = dict(self._counters)
+        now = time.monotonic()
+        workers = []
+        for worker_id, worker in sorted(live.items()):
+            workers.append(dict(memory_stats(worker["pid"]), id=worker_id, pid=worker["pid"],
+                                requests=worker["requests"], uptime_s=round(now - worker["started"], 1)))
+        server = dict(memory_stats(self._server.pid), pid=self._server.pid)
+        return {
+            "workers": workers,
+            "fork_server": server,
+            # PSS splits shared pages between the processes that map them, so this is what the pool really costs
+            "total_pss_mb": round(server.get("pss_mb", 0) + sum(w.get("pss_mb", 0) for w in workers), 1),
+            "queue_depth": self._tasks.qsize(),
+            "max_requests": self.max_requests,
+            "max_rss_mb": self.max_rss_mb,
+            "counters": counters
+        }
+
+    def close(self):
+        """Accept no more tasks; workers stop once the queued ones are done"""
+        self._closing = True
+        for _ in range(self.workers):
+            self._tasks.put(_STOP)
+
+    def join(self):
+        """Wait for the workers to finish, then stop the fork server"""
+        while True:
+            with self._lock:
+                threads = [thread for thread in self._threads if thread.is_alive()]
+            if not threads:
+                break
+            for thread in threads:
+                thread.join()
+        try:
+            self._commands.send(("exit",))
+        except OSError:
+            pass
+        self._server.join()
+        self._listener.close()
+
+    # Worker lifecycle
+
+    def _spawn(self):
+        with self._lock:
+            self._counters["spawned"] += 1
+            self._commands.send(("spawn", next(self._ids)))
+
+    def _accept(self):
+        while True:
+            try:
+                conn = self._listener.accept()
+                _, worker_id, pid = conn.recv()
+            except (OSError, EOFError):
+                if self._closing:
+                    return
+                continue
+            with self._lock:
+                self._live[worker_id] = {"pid": pid, "requests": 0, "started": time.monotonic()}
+                thread = threading.Thread(target=self._run, args=(worker_id, conn), daemon=True)
+                self._threads = [t for t in self._threads if t.is_alive()] + [thread]
+            thread.start()
+
+    def _run(self, worker_id, conn):
+        """Feed one worker tasks until the pool closes or the worker is due for recycling"""
+        reason = None
+        while reason is None:
+            task = self._tasks.get()
+            if task is _STOP:
+                conn.send(("stop",))
+                break
+            name, args, callback, error_callback = task
+            try:
+                conn.send(("task", name, args))
+                ok, value, rss = conn.recv()
+            except (EOFError, OSError) as e:
+                reason = "crashed"
+                ok, value, rss = False, f"Worker exited: {str(e) or 'connection closed'}", 0.0
+
+            with self._lock:
+                worker = self._live[worker_id]
+                worker["requests"] += 1
+                self._counters["tasks"] += 1
+                self._counters["failed"] += 0 if ok else 1
+                if reason is None and self.max_requests and worker["requests"] >= self.max_requests:
+                    reason = "recycled_requests"
+                elif reason is None and self.max_rss_mb and rss > self.max_rss_mb:
+                    reason = "recycled_rss"
+
+            if ok:
+                if callback is not None:
+                    callback(value)
+            elif error_callback is not None:
+                error_callback(WorkerError(value))
+
+        if reason is not None:
+            # Start the replacement before this worker exits so capacity never drops by more than one
+            if not self._closing:
+                self._spawn()
+            if reason != "crashed":
+                conn.send(("stop",))
+        conn.close()
+        with self._lock:
+            self._live.pop(worker_id, None)
+            if reason is not None:
+                self._counters[reason] += 1
@@ -0,0 +1,108 @@
+#crimecard-backend\scripts\benchBackends.py
+"""Latency, memory and output drift of each summarizer backend.
+
+Each backend (CRIMECARD_SUMMARIZER) runs in its own interpreter, so its load
+time and peak RSS are measured in isolation. Every sample report is summarized
+several times, and the summaries are compared with the tf reference backend
+by word overlap. Backends whose dependencies are missing are reported as
+unavailable.
+
+Usage: python scripts/benchBackends.py [--backends tf,tf-xla,onnx,onnx-int8] [--runs N] [--output FILE]
+"""
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+from benchSummaries import overlap
+from sampleReports import load_samples, load_service
+
+def measure(runs):
+    """Run in the worker interpreter: time the configured backend over the sample reports"""
+    service = load_service()
+    reports = load_samples()
+
+    start = time.perf_counter()
+    service.load_summarizer()
+    load_s = time.perf_counter() - start
+
+    # The first call pays for graph tracing or session warm-up
+    start = time.perf_counter()
+    service.generate_summaries_batch(reports[:1])
+    first_call_s = time.perf_counter() - start
+
+    latencies, summaries = [], []
+    for _ in range(runs):
+        summaries = []
+        for report in reports:
+            start = time.perf_counter()
+            summary, headline, info = service.generate_summaries_batch([report])[0]
+            latencies.append((time.perf_counter() - start) * 1000)
+            summaries.append({"summary": summary, "headline": headline, "summarizer": info["summarizer"]})
+
+    ordered = sorted(latencies)
+    return {
+        "load_s": round(load_s, 3),
+        "first_call_s": round(first_call_s, 3),
+        "p50_ms": round(statistics.median(ordered), 1),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))], 1),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "summaries": summaries
+    }
+
+def run_backend(backend, runs):
+    env = dict(os.environ, CRIMECARD_SUMMARIZER=backend, CRIMECARD_RESULT_CACHE="0")
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker", "--runs", str(runs)],
+        capture_output=True, text=True, env=env
+    )
+    if proc.returncode != 0:
+        return {"error": proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "worker failed"}
+    return json.loads(proc.stdout)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backends", default="tf,tf-xla,onnx,onnx-int8")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--output", help="save the results as JSON")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(measure(args.runs)))
+        return
+
+    backends = args.backends.split(",")
+    if "tf" not in backends:
+        backends.insert(0, "tf")
+    results = {}
+    for backend in backends:
+        print(f"{backend}...", file=sys.stderr)
+        results[backend] = run_backend(backend, args.runs)
+
+    reference = results["tf"].get("summaries")
+    print(f"{'backend':10s} {'load s':>7s} {'1st s':>7s} {'p50 ms':>8s} {'p95 ms':>8s} {'RSS MB':>8s} "
+          f"{'summary ovl':>12s} {'headline ovl':>13s}")
+    for backend, result in results.items():
+        if "error" in result:
+            print(f"{backend:10s} unavailable: {result['error']}")
+            continue
+        if reference:
+            pairs = list(zip(reference, result["summaries"]))
+            result["summary_overlap"] = round(statistics.mean(overlap(a["summary"], b["summary"]) for a, b in pairs), 3)
+            result["headline_overlap"] = round(statistics.mean(overlap(a["headline"], b["headline"]) for a, b in pairs), 3)
+        print(f"{backend:10s} {result['load_s']:7.2f} {result['first_call_s']:7.2f} {result['p50_ms']:8.1f} "
+              f"{result['p95_ms']:8.1f} {result['peak_rss_mb']:8.1f} "
+              f"{result.get('summary_overlap', float('nan')):12.3f} {result.get('headline_overlap', float('nan')):13.3f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved {args.output}")
+
+if __name__ == "__main__":
+    main()
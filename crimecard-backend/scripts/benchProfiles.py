@@ -0,0 +1,139 @@
+#crimecard-backend\scripts\benchProfiles.py
+"""Speed, memory and accuracy of each spaCy pipeline profile.
+
+Every profile (fast, balanced, accurate) is loaded in its own interpreter so
+that load time and peak RSS are not shared. Each one parses and analyzes the
+sample reports plus a synthesized corpus. Its entities, classifications and
+severities are then scored against the reference profile (accurate by default):
+precision, recall and F1 for each entity list, and the agreement rate for
+classification and severity. Profiles whose model is not installed are skipped.
+
+Usage: python scripts/benchProfiles.py [--profiles fast,balanced,accurate] [--reference accurate]
+                                       [--corpus N] [--output FILE]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+from sampleReports import load_samples, load_service, synthesize_corpus
+
+ENTITY_FIELDS = ["persons", "locations", "dates", "weapons", "victims", "suspects", "officers"]
+
+def measure(corpus_size):
+    """Run in the worker interpreter: time the selected profile and return its analyses"""
+    service = load_service()
+    reports = load_samples()
+    corpus = synthesize_corpus(reports, corpus_size)
+
+    start = time.perf_counter()
+    nlp = service.load_spacy()
+    service.load_rule_engine()
+    load_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    docs = service.parse_many(corpus)
+    parse_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for text, doc in zip(corpus, docs):
+        service.analyze_text(text, doc)
+    analyze_s = time.perf_counter() - start
+
+    analyses = []
+    for report, doc in zip(reports, service.parse_many(reports)):
+        entities, crime_type, confidence, severity = service.analyze_text(report, doc)
+        analyses.append({"entities": entities, "classification": crime_type, "severity": severity})
+
+    return {
+        "model": f"{nlp.meta.get('lang')}_{nlp.meta.get('name')}-{nlp.meta.get('version')}",
+        "components": nlp.pipe_names,
+        "load_s": round(load_s, 3),
+        "parse_docs_per_s": round(len(corpus) / parse_s, 2),
+        "analyze_docs_per_s": round(len(corpus) / analyze_s, 2),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "analyses": analyses
+    }
+
+def run_profile(profile, corpus_size):
+    env = dict(os.environ, CRIMECARD_SPACY_PROFILE=profile, CRIMECARD_RESULT_CACHE="0")
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker", "--corpus", str(corpus_size)],
+        capture_output=True, text=True, env=env
+    )
+    if proc.returncode != 0:
+        return {"error": proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "worker failed"}
+    return json.loads(proc.stdout)
+
+def agreement(reference, candidate):
+    """Entity precision/recall/F1 and label agreement of candidate analyses against reference ones"""
+    scores = {}
+    for field in ENTITY_FIELDS:
+        true_pos = false_pos = false_neg = 0
+        for ref, cand in zip(reference, candidate):
+            expected, found = set(ref["entities"][field]), set(cand["entities"][field])
+            true_pos += len(expected & found)
+            false_pos += len(found - expected)
+            false_neg += len(expected - found)
+        precision = true_pos / (true_pos + false_pos) if true_pos + false_pos else 1.0
+        recall = true_pos / (true_pos + false_neg) if true_pos + false_neg else 1.0
+        f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+        scores[field] = {"precision": round(precision, 3), "recall": round(recall, 3), "f1": round(f1, 3)}
+
+    total = len(reference)
+    scores["classification"] = round(
+        sum(ref["classification"] == cand["classification"] for ref, cand in zip(reference, candidate)) / total, 3
+    )
+    scores["severity"] = round(sum(ref["severity"] == cand["severity"] for ref, cand in zip(reference, candidate)) / total, 3)
+    return scores
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", default="fast,balanced,accurate")
+    parser.add_argument("--reference", default="accurate", help="profile whose outputs count as correct")
+    parser.add_argument("--corpus", type=int, default=64, help="synthesized reports for the throughput run")
+    parser.add_argument("--output", help="save the results as JSON")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(measure(args.corpus)))
+        return
+
+    profiles = args.profiles.split(",")
+    if args.reference not in profiles:
+        profiles.append(args.reference)
+    results = {}
+    for profile in profiles:
+        print(f"{profile}...", file=sys.stderr)
+        results[profile] = run_profile(profile, args.corpus)
+
+    reference = results[args.reference]
+    if "error" in reference:
+        print(f"Reference profile {args.reference} unavailable: {reference['error']}")
+        sys.exit(1)
+
+    print(f"{'profile':10s} {'load s':>7s} {'parse/s':>9s} {'analyze/s':>10s} {'RSS MB':>8s} "
+          f"{'persons F1':>11s} {'roles F1':>9s} {'class':>6s} {'sev':>6s}")
+    for profile, result in results.items():
+        if "error" in result:
+            print(f"{profile:10s} unavailable: {result['error']}")
+            continue
+        result["accuracy"] = agreement(reference["analyses"], result["analyses"])
+        accuracy = result["accuracy"]
+        roles_f1 = sum(accuracy[field]["f1"] for field in ("victims", "suspects", "officers")) / 3
+        print(f"{profile:10s} {result['load_s']:7.2f} {result['parse_docs_per_s']:9.1f} "
+              f"{result['analyze_docs_per_s']:10.1f} {result['peak_rss_mb']:8.1f} "
+              f"{accuracy['persons']['f1']:11.3f} {roles_f1:9.3f} "
+              f"{accuracy['classification']:6.2f} {accuracy['severity']:6.2f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved {args.output}")
+
+if __name__ == "__main__":
+    main()
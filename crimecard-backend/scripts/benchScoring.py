@@ -0,0 +1,78 @@
+#crimecard-backend\scripts\benchScoring.py
+"""Per-report versus vectorized classification and severity scoring.
+
+Builds a large set of synthetic reports as random keyword hits over the
+scoring vocabulary, with random victim counts and weapons, so every rule of
+classify_crime and calculate_severity is exercised without loading any model.
+Both paths score the same reports; the script checks that every result is
+identical and reports the throughput of each.
+
+Usage: python scripts/benchScoring.py [--reports N] [--seed N]
+"""
+import argparse
+import random
+import sys
+import time
+
+from sampleReports import load_service
+
+WEAPONS = ["gun", "Pistol", "kitchen knife", "blade", "acid", "bomb", "rope", "hammer", "Rifle", "explosive device"]
+
+def synthesize(service, count, seed):
+    """(hits, entities) pairs drawn from the scoring vocabulary"""
+    from keywordIndex import KeywordHits
+
+    rng = random.Random(seed)
+    vocabulary = service.load_keyword_index().vocabulary
+    terms = sorted(service.load_batch_scorer().terms)
+    # Some noise terms that do not score, like any real report has
+    noise = sorted(vocabulary - set(terms))[:20]
+    reports = []
+    for _ in range(count):
+        present = rng.sample(terms, rng.choice([0, 0, 1, 2, 3, 5, 8])) + rng.sample(noise, rng.randint(0, 3))
+        hits = KeywordHits({term: [0] for term in present}, vocabulary)
+        entities = {
+            "victims": [f"Victim {n}" for n in range(rng.choice([0, 0, 1, 1, 2, 3, 5]))],
+            "weapons": rng.sample(WEAPONS, rng.choice([0, 0, 0, 1, 2]))
+        }
+        reports.append((hits, entities))
+    return reports
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    service = load_service()
+    reports = synthesize(service, args.reports, args.seed)
+    hits_list = [hits for hits, _ in reports]
+    entities_list = [entities for _, entities in reports]
+
+    start = time.perf_counter()
+    expected = []
+    for hits, entities in reports:
+        crime_type, confidence = service.classify_crime(None, entities, hits)
+        expected.append((crime_type, confidence, service.calculate_severity(None, crime_type, entities, hits)))
+    loop_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = service.score_reports(None, entities_list, hits_list)
+    batch_s = time.perf_counter() - start
+
+    mismatches = [i for i, (a, b) in enumerate(zip(expected, actual)) if a != b]
+    print(f"{args.reports} reports: per-report {loop_s:.2f}s ({args.reports / loop_s:,.0f}/s), "
+          f"batch {batch_s:.2f}s ({args.reports / batch_s:,.0f}/s), {loop_s / batch_s:.1f}x")
+    classes = {}
+    for crime_type, _, _ in expected:
+        classes[crime_type] = classes.get(crime_type, 0) + 1
+    print("classes:", ", ".join(f"{crime} {count}" for crime, count in sorted(classes.items())))
+    if mismatches:
+        for i in mismatches[:10]:
+            print(f"report {i}: expected {expected[i]}, got {actual[i]}", file=sys.stderr)
+        print(f"{len(mismatches)} mismatches", file=sys.stderr)
+        sys.exit(1)
+    print("all results identical")
+
+if __name__ == "__main__":
+    main()
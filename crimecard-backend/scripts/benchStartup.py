@@ -0,0 +1,139 @@
+#crimecard-backend\scripts\benchStartup.py
+"""Startup-time benchmark for each nlpService.py command.
+
+Runs every command in a fresh interpreter several times and reports the
+wall-clock time along with which heavy libraries were imported. `extract`
+is timed on a TXT, a DOCX and a PDF made from the sample report; the backend
+only sends DOCX and PDF files to Python, and those pull in python-docx or
+pdfplumber and the result cache. Every `extract` must stay well under a
+second and must not import spaCy, TensorFlow or transformers; the script
+exits non-zero when that budget is broken.
+
+Usage: python scripts/benchStartup.py [--runs N] [--extract-budget SECONDS] [--skip-process]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVICE_DIR = os.path.join(BACKEND_DIR, "app", "services")
+SAMPLE_PATH = os.path.join(BACKEND_DIR, "..", "test1.txt")
+HEAVY_MODULES = ["spacy", "tensorflow", "transformers"]
+
+# Runs a command in-process and reports which heavy modules it pulled in
+PROBE = """
+import json, sys
+sys.path.insert(0, {service_dir!r})
+sys.argv = ["nlpService.py"] + {args!r}
+import runpy, io, contextlib
+with contextlib.redirect_stdout(io.StringIO()):
+    runpy.run_path({script!r}, run_name="__main__")
+print(json.dumps({{m: m in sys.modules for m in {heavy!r}}}), file=sys.stderr)
+"""
+
+def write_docx(path, paragraphs):
+    import docx
+    document = docx.Document()
+    for paragraph in paragraphs:
+        document.add_paragraph(paragraph)
+    document.save(path)
+
+def write_pdf(path, lines, lines_per_page=40):
+    """A plain PDF with one Helvetica text line per report line, so no PDF library is needed to write it"""
+    # Standard 14 fonts only cover Latin-1
+    lines = [line.encode("latin-1", "replace").decode("latin-1") for line in lines]
+    escape = lambda line: line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    font_id = 3 + 2 * len(pages)
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{' '.join(f'{3 + 2 * i} 0 R' for i in range(len(pages)))}] /Count {len(pages)} >>"
+    ]
+    for i, page in enumerate(pages):
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {4 + 2 * i} 0 R "
+                       f"/Resources << /Font << /F1 {font_id} 0 R >> >> >>")
+        stream = "BT /F1 10 Tf 14 TL 40 760 Td " + " ".join(f"({escape(line)}) Tj T*" for line in page) + " ET"
+        objects.append(f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out, offsets = "%PDF-1.4\n", []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out.encode("latin-1")))
+        out += f"{number} 0 obj\n{body}\nendobj\n"
+    xref = len(out.encode("latin-1"))
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n" + "".join(f"{o:010d} 00000 n \n" for o in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    with open(path, "wb") as f:
+        f.write(out.encode("latin-1"))
+
+def run_command(args):
+    """Run one cold invocation and return (seconds, imported heavy modules)"""
+    code = PROBE.format(
+        service_dir=SERVICE_DIR,
+        script=os.path.join(SERVICE_DIR, "nlpService.py"),
+        args=args,
+        heavy=HEAVY_MODULES,
+    )
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"{args[0]} failed: {proc.stderr.strip()}")
+    imported = json.loads(proc.stderr.strip().splitlines()[-1])
+    return elapsed, [m for m, loaded in imported.items() if loaded]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--extract-budget", type=float, default=1.0)
+    parser.add_argument("--skip-process", action="store_true", help="skip the model-loading process command")
+    args = parser.parse_args()
+
+    with open(SAMPLE_PATH, encoding="utf-8") as f:
+        sample = f.read()
+
+    lines = [line.strip() for line in sample.splitlines() if line.strip()]
+    tmp = tempfile.TemporaryDirectory()
+    txt_path, docx_path, pdf_path = (os.path.join(tmp.name, f"sample.{ext}") for ext in ("txt", "docx", "pdf"))
+    with open(txt_path, "w", encoding="utf-8") as f:
+        f.write(sample)
+    write_docx(docx_path, lines)
+    write_pdf(pdf_path, lines)
+
+    commands = {
+        "extract txt": ["extract", txt_path],
+        "extract docx": ["extract", docx_path],
+        "extract pdf": ["extract", pdf_path]
+    }
+    if not args.skip_process:
+        commands["process"] = ["process", sample]
+
+    failed = False
+    try:
+        for name, cmd in commands.items():
+            times = []
+            for _ in range(args.runs):
+                elapsed, imported = run_command(cmd)
+                times.append(elapsed)
+            median = statistics.median(times)
+            print(f"{name:12s} median {median:.3f}s  min {min(times):.3f}s  heavy imports: {', '.join(imported) or 'none'}")
+
+            if name.startswith("extract"):
+                if median > args.extract_budget:
+                    print(f"  FAIL: {name} startup {median:.3f}s exceeds budget {args.extract_budget:.3f}s")
+                    failed = True
+                if imported:
+                    print(f"  FAIL: {name} imported {', '.join(imported)}")
+                    failed = True
+    finally:
+        tmp.cleanup()
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
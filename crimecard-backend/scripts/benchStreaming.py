@@ -0,0 +1,106 @@
+#crimecard-backend\scripts\benchStreaming.py
+"""Peak memory and time of whole-Doc versus windowed entity extraction.
+
+For each document size, a long document is synthesized from the sample
+reports and its entities are extracted twice, each in a fresh interpreter so
+peak RSS is measured in isolation: once as a single Doc (skipped past
+nlp.max_length, where spaCy refuses the text) and once in overlapping
+windows. The windowed persons, locations, weapons and roles are compared
+with the whole-Doc ones.
+
+Usage: python scripts/benchStreaming.py [--words 20000,100000,400000] [--window-chars N] [--output FILE]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+from sampleReports import load_samples, load_service, long_document
+
+CATEGORIES = ["persons", "locations", "weapons", "victims", "suspects", "officers"]
+
+def measure(mode, words, window_chars):
+    """Run in the worker interpreter: extract the entities of one synthesized document"""
+    service = load_service()
+    text = long_document(load_samples(), words, seed=0)
+    nlp = service.load_spacy()
+    service.load_rule_engine()
+    service.load_keyword_index()
+    baseline_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    start = time.perf_counter()
+    if mode == "doc":
+        if len(text) > nlp.max_length:
+            return {"skipped": f"{len(text)} chars exceeds nlp.max_length ({nlp.max_length})"}
+        entities = service.extract_entities(text)
+        windows = 1
+    else:
+        entities, stats = service.extract_entities_streaming([text], window_chars=window_chars)
+        windows = stats["windows"]
+    elapsed = time.perf_counter() - start
+
+    return {
+        "chars": len(text),
+        "seconds": round(elapsed, 2),
+        "windows": windows,
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "models_rss_mb": round(baseline_mb, 1),
+        "entities": {category: sorted(set(entities[category])) for category in CATEGORIES}
+    }
+
+def run_worker(mode, words, window_chars):
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker", mode, "--words", str(words),
+         "--window-chars", str(window_chars)],
+        capture_output=True, text=True, env=dict(os.environ, CRIMECARD_RESULT_CACHE="0")
+    )
+    if proc.returncode != 0:
+        return {"error": proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "worker failed"}
+    return json.loads(proc.stdout)
+
+def agreement(reference, candidate):
+    """Share of the reference entities the candidate also found, per category"""
+    return {
+        category: round(len(set(reference[category]) & set(candidate[category])) / len(reference[category]), 3)
+        if reference[category] else 1.0
+        for category in CATEGORIES
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", default="20000,100000,400000")
+    parser.add_argument("--window-chars", type=int, default=20000)
+    parser.add_argument("--output", help="save the results as JSON")
+    parser.add_argument("--worker", choices=["doc", "stream"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(measure(args.worker, int(args.words), args.window_chars)))
+        return
+
+    results = {}
+    print(f"{'words':>8s} {'mode':6s} {'chars':>9s} {'windows':>8s} {'seconds':>8s} {'RSS MB':>8s} agreement")
+    for words in [int(w) for w in args.words.split(",")]:
+        runs = {mode: run_worker(mode, words, args.window_chars) for mode in ["doc", "stream"]}
+        reference = runs["doc"].get("entities")
+        for mode, run in runs.items():
+            if "error" in run or "skipped" in run:
+                print(f"{words:8d} {mode:6s} {run.get('error') or run['skipped']}")
+                continue
+            if mode == "stream" and reference:
+                run["agreement"] = agreement(reference, run["entities"])
+            shown = " ".join(f"{k} {v:.2f}" for k, v in run.get("agreement", {}).items())
+            print(f"{words:8d} {mode:6s} {run['chars']:9d} {run['windows']:8d} {run['seconds']:8.2f} "
+                  f"{run['peak_rss_mb']:8.1f} {shown}")
+        results[words] = runs
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+#crimecard-backend\scripts\benchSuite.py
+"""Reproducible latency, throughput and output-identity benchmark.
+
+`run` splits the sample files into reports, synthesizes a larger corpus and a
+long document from them, and measures cold start, warm process_text latency,
+per-stage times, batch throughput and peak RSS with the result cache off.
+Every analysis (entities, classification, confidence, severity) is hashed so
+that a later run can confirm optimizations left the outputs unchanged, and the
+run fails if any report goes through the spaCy pipeline more than once.
+
+`compare` reads two saved runs, prints the change of every metric and exits
+non-zero when latency or throughput regressed past the threshold or any
+output changed.
+
+Usage: python scripts/benchSuite.py run [--output FILE] [--runs N] [--corpus N] [--batch-size N]
+                                       [--long-words N] [--skip-cold] [--skip-summary]
+       python scripts/benchSuite.py compare BASELINE CANDIDATE [--threshold FRACTION] [--min-delta-ms MS]
+"""
+import argparse
+import hashlib
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+# Timings must not be served from a cache, near-duplicate index or Doc store filled by an earlier run
+os.environ["CRIMECARD_RESULT_CACHE"] = "0"
+os.environ["CRIMECARD_DEDUP"] = "0"
+os.environ["CRIMECARD_DOC_STORE"] = "0"
+
+from sampleReports import SERVICE_DIR, load_samples, load_service, long_document, synthesize_corpus
+
+# Metrics where a larger value is a regression; the rest (throughput) regress when they shrink
+LOWER_IS_BETTER = ("_ms", "_mb")
+
+def percentiles(values):
+    """p50/p95/p99 (nearest rank), mean and count of a list of milliseconds"""
+    ordered = sorted(values)
+    if not ordered:
+        return {}
+    pick = lambda q: ordered[min(len(ordered) - 1, max(0, int(round(q * len(ordered) + 0.5)) - 1))]
+    return {
+        "p50_ms": round(pick(0.50), 3),
+        "p95_ms": round(pick(0.95), 3),
+        "p99_ms": round(pick(0.99), 3),
+        "mean_ms": round(statistics.mean(ordered), 3),
+        "count": len(ordered)
+    }
+
+def peak_rss_mb():
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return round(usage / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+def text_key(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+def output_digest(result):
+    """Hash of the analysis fields that optimizations must not change"""
+    entities = dict(result["entities"])
+    for role in ("victims", "suspects", "officers"):
+        entities[role] = sorted(entities[role])
+    analysis = {
+        "entities": entities,
+        "classification": result["classification"],
+        "confidence": round(result["confidence"], 6),
+        "severityScore": result["severityScore"]
+    }
+    return hashlib.sha256(json.dumps(analysis, sort_keys=True).encode("utf-8")).hexdigest()
+
+def check_pipeline_calls(service, before, expected, what):
+    """Fail the run unless exactly `expected` pipeline runs happened since `before`"""
+    calls = service.pipeline_calls - before
+    if calls != expected:
+        raise RuntimeError(f"{what} ran the spaCy pipeline {calls} times, expected {expected}")
+
+def cold_start(report, runs):
+    """Wall time of `nlpService.py process` in a fresh interpreter, model loading included"""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, os.path.join(SERVICE_DIR, "nlpService.py"), "process", report],
+            capture_output=True, text=True
+        )
+        times.append((time.perf_counter() - start) * 1000)
+        if proc.returncode != 0:
+            raise RuntimeError(f"process failed: {proc.stderr.strip()}")
+    return percentiles(times)
+
+def run(args):
+    service = load_service()
+    reports = load_samples()
+    corpus = synthesize_corpus(reports, args.corpus, seed=args.seed)
+    long_doc = long_document(reports, args.long_words, seed=args.seed)
+
+    if args.skip_summary:
+        # Analysis only: every summary takes the cheap extractive path
+        service.generate_summaries_batch = lambda texts, docs=None, **kwargs: [
+            (summary, summary, {"summarizer": "extractive", "degraded": False})
+            for summary in (service.extractive_fallback(text, doc) for text, doc in zip(texts, docs or [None] * len(texts)))
+        ]
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "packages": {name: service.package_version(name) for name in ("spacy", "transformers", "tensorflow", "numpy")},
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "args": vars(args),
+            "reports": len(reports)
+        }
+    }
+
+    if not args.skip_cold:
+        print("cold start...", file=sys.stderr)
+        results["cold_start"] = cold_start(reports[0], args.cold_runs)
+
+    start = time.perf_counter()
+    service.load_models()
+    results["model_load_ms"] = round((time.perf_counter() - start) * 1000, 3)
+
+    # Warm single-report latency, with a per-stage breakdown from the timings block
+    print("warm process_text...", file=sys.stderr)
+    outputs = {}
+    latencies, stages = [], {}
+    service.process_text(reports[0])  # first call pays for lazy setup
+    for _ in range(args.runs):
+        for report in reports:
+            calls = service.pipeline_calls
+            start = time.perf_counter()
+            result = service.process_text(report, timings=True)
+            latencies.append((time.perf_counter() - start) * 1000)
+            check_pipeline_calls(service, calls, 1, "process_text")
+            for name, stage in result["timings"]["stages"].items():
+                stages.setdefault(name, []).append(stage["wall_ms"])
+            outputs[text_key(report)] = output_digest(result)
+    results["warm"] = percentiles(latencies)
+    results["stages"] = {name: percentiles(values) for name, values in stages.items()}
+
+    # Batched throughput over the synthesized corpus
+    print(f"batch throughput over {len(corpus)} reports...", file=sys.stderr)
+    batch_latencies = []
+    start = time.perf_counter()
+    for i in range(0, len(corpus), args.batch_size):
+        batch = corpus[i:i + args.batch_size]
+        calls = service.pipeline_calls
+        batch_start = time.perf_counter()
+        batch_results = service.process_texts(batch)
+        batch_latencies.append((time.perf_counter() - batch_start) * 1000)
+        check_pipeline_calls(service, calls, len(batch), "process_texts")
+        for text, result in zip(batch, batch_results):
+            outputs[text_key(text)] = output_digest(result)
+    elapsed = time.perf_counter() - start
+    results["batch"] = dict(percentiles(batch_latencies), batch_size=args.batch_size,
+                            reports_per_s=round(len(corpus) / elapsed, 3))
+
+    # One long document, exercising chunked summarization and long-text analysis
+    print(f"long document ({len(long_doc.split())} words)...", file=sys.stderr)
+    long_latencies = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        result = service.process_text(long_doc)
+        long_latencies.append((time.perf_counter() - start) * 1000)
+    outputs[text_key(long_doc)] = output_digest(result)
+    results["long_document"] = dict(percentiles(long_latencies), words=len(long_doc.split()))
+
+    results["peak_rss_mb"] = peak_rss_mb()
+    results["outputs"] = outputs
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"warm p50 {results['warm']['p50_ms']:.1f}ms p95 {results['warm']['p95_ms']:.1f}ms "
+          f"p99 {results['warm']['p99_ms']:.1f}ms | batch {results['batch']['reports_per_s']:.2f} reports/s | "
+          f"peak RSS {results['peak_rss_mb']:.1f}MB")
+    print(f"Saved {args.output}")
+
+def flatten(results, prefix=""):
+    """Numeric metrics of a saved run as {"warm.p50_ms": value, ...}"""
+    metrics = {}
+    for key, value in results.items():
+        if key in ("meta", "outputs"):
+            continue
+        if isinstance(value, dict):
+            metrics.update(flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, (int, float)) and not key.endswith("count") and key not in ("batch_size", "words"):
+            metrics[prefix + key] = value
+    return metrics
+
+def compare(args):
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.candidate, encoding="utf-8") as f:
+        candidate = json.load(f)
+
+    regressions = []
+    base_metrics, new_metrics = flatten(baseline), flatten(candidate)
+    for name in sorted(set(base_metrics) & set(new_metrics)):
+        old, new = base_metrics[name], new_metrics[name]
+        change = (new - old) / old if old else 0.0
+        if name.endswith("_ms"):
+            # Sub-millisecond stages are too noisy to judge by relative change alone
+            worse = change > args.threshold and new - old > args.min_delta_ms
+        elif name.endswith(LOWER_IS_BETTER):
+            worse = change > args.threshold
+        else:
+            worse = change < -args.threshold
+        flag = "  REGRESSION" if worse else ""
+        print(f"{name:45s} {old:12.3f} -> {new:12.3f} ({change:+.1%}){flag}")
+        if worse:
+            regressions.append(name)
+
+    changed = [key for key, digest in candidate["outputs"].items()
+               if key in baseline["outputs"] and baseline["outputs"][key] != digest]
+    compared = len(set(candidate["outputs"]) & set(baseline["outputs"]))
+    print(f"\nOutputs: {compared - len(changed)}/{compared} identical")
+    for key in changed:
+        print(f"  CHANGED: report {key}")
+
+    if regressions or changed:
+        print(f"\n{len(regressions)} metric regression(s), {len(changed)} changed output(s)")
+        sys.exit(1)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="benchmark the service and save the results")
+    run_parser.add_argument("--output", default="bench-results.json")
+    run_parser.add_argument("--runs", type=int, default=5, help="passes over the sample reports")
+    run_parser.add_argument("--corpus", type=int, default=64, help="synthesized reports for the throughput run")
+    run_parser.add_argument("--batch-size", type=int, default=8)
+    run_parser.add_argument("--long-words", type=int, default=3000, help="length of the long document")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--cold-runs", type=int, default=3)
+    run_parser.add_argument("--skip-cold", action="store_true", help="skip the fresh-interpreter cold start")
+    run_parser.add_argument("--skip-summary", action="store_true", help="use the extractive summary instead of T5")
+
+    compare_parser = commands.add_parser("compare", help="compare two saved runs")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="relative change that counts as a regression")
+    compare_parser.add_argument("--min-delta-ms", type=float, default=1.0,
+                                help="smallest latency increase that counts as a regression")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args)
+    else:
+        compare(args)
+
+if __name__ == "__main__":
+    main()
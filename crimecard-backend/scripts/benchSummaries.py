@@ -0,0 +1,66 @@
+#crimecard-backend\scripts\benchSummaries.py
+"""Compare the single-call summary+headline path with the old two-call path.
+
+For every sample report this times two generate_summary calls (max_length 150
+and 75) against one generate_summaries call, and prints both outputs with
+their word overlap so any change in wording is visible.
+
+Usage: python scripts/benchSummaries.py [--runs N]
+"""
+import argparse
+import statistics
+import time
+
+from sampleReports import load_samples, load_service
+
+def overlap(a, b):
+    """Share of words in common between two strings"""
+    words_a, words_b = set(a.lower().split()), set(b.lower().split())
+    if not words_a or not words_b:
+        return 1.0 if words_a == words_b else 0.0
+    return len(words_a & words_b) / len(words_a | words_b)
+
+def timed(func, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return result, times
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    service = load_service()
+    service.load_models()
+
+    two_call_times, single_times = [], []
+    for i, report in enumerate(load_samples(), 1):
+        doc = service.parse(report)
+
+        (summary_a, headline_a), times_a = timed(
+            lambda: (service.generate_summary(report, max_length=150, doc=doc),
+                     service.generate_summary(report, max_length=75, doc=doc)),
+            args.runs
+        )
+        (summary_b, headline_b), times_b = timed(
+            lambda: service.generate_summaries(report, doc),
+            args.runs
+        )
+        two_call_times.extend(times_a)
+        single_times.extend(times_b)
+
+        print(f"Report {i}: two calls {statistics.median(times_a):.3f}s, single call {statistics.median(times_b):.3f}s")
+        print(f"  summary  overlap {overlap(summary_a, summary_b):.2f}{'' if summary_a == summary_b else ' (changed)'}")
+        print(f"  headline overlap {overlap(headline_a, headline_b):.2f}{'' if headline_a == headline_b else ' (changed)'}")
+        if headline_a != headline_b:
+            print(f"    two calls:   {headline_a}")
+            print(f"    single call: {headline_b}")
+
+    two_call, single = statistics.median(two_call_times), statistics.median(single_times)
+    print(f"\nMedian latency: two calls {two_call:.3f}s, single call {single:.3f}s ({two_call / single:.2f}x)")
+
+if __name__ == "__main__":
+    main()
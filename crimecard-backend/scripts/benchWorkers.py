@@ -0,0 +1,99 @@
+#crimecard-backend\scripts\benchWorkers.py
+"""Memory of a fork-server worker pool versus independent worker processes.
+
+One independent worker (a fresh interpreter that loads its own models) is
+measured after processing the sample reports; N of them cost N times its
+memory. The pool loads spaCy and the rules once, forks N workers that each
+load T5 (as `http --workers` does, since TensorFlow is not fork-safe) and
+runs the same reports through every worker, then reports its total PSS,
+which counts each shared page once across the fork server and the workers.
+
+Usage: python scripts/benchWorkers.py [--workers 2,4,8] [--output FILE]
+"""
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import threading
+
+from sampleReports import load_samples, load_service
+
+def run_reports(pool, reports, copies):
+    """Push every report through the pool copies times and wait for all of them"""
+    done = threading.Semaphore(0)
+    errors = []
+    for _ in range(copies):
+        for report in reports:
+            pool.apply_async(pool.service.process_text, (report,), lambda result: done.release(),
+                             lambda error: (errors.append(str(error)), done.release()))
+    for _ in range(copies * len(reports)):
+        done.acquire()
+    return errors
+
+def measure_single():
+    """Run in the worker interpreter: memory of one process with its own models"""
+    service = load_service()
+    from workerPool import memory_stats
+    service.load_models()
+    service.load_keyword_index()
+    for report in load_samples():
+        service.process_text(report)
+    return memory_stats()
+
+def measure_pool(workers):
+    service = load_service()
+    from workerPool import ForkServerPool
+    service.load_spacy()
+    service.load_rule_engine()
+    service.load_keyword_index()
+    gc.freeze()
+    pool = ForkServerPool(service, workers, initializer="load_summarizer")
+    errors = run_reports(pool, load_samples(), workers)
+    stats = pool.stats()
+    pool.close()
+    pool.join()
+    return {"total_pss_mb": stats["total_pss_mb"], "workers": stats["workers"],
+            "fork_server": stats["fork_server"], "errors": errors[:3]}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", default="2,4,8")
+    parser.add_argument("--output", help="save the results as JSON")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    env = dict(os.environ, CRIMECARD_RESULT_CACHE="0", CRIMECARD_DEDUP="0")
+    if args.worker:
+        print(json.dumps(measure_single()))
+        return
+
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--worker"],
+                          capture_output=True, text=True, env=env)
+    if proc.returncode != 0:
+        print(f"Independent worker failed: {proc.stderr.strip()}", file=sys.stderr)
+        sys.exit(1)
+    single = json.loads(proc.stdout)
+    single_mb = single.get("pss_mb", single["rss_mb"])
+    print(f"one independent worker: {single_mb:.1f} MB")
+
+    # The pool runs in this process, with the result cache and dedup index off as in the worker
+    os.environ.update(CRIMECARD_RESULT_CACHE="0", CRIMECARD_DEDUP="0")
+    results = {"independent_worker_mb": single_mb, "pools": {}}
+    print(f"{'workers':>8s} {'independent MB':>15s} {'pool MB':>9s} {'saving':>7s} {'private MB/worker':>18s}")
+    for workers in [int(n) for n in args.workers.split(",")]:
+        pool = measure_pool(workers)
+        private = sum(w.get("private_mb", 0) for w in pool["workers"]) / max(1, len(pool["workers"]))
+        independent = single_mb * workers
+        print(f"{workers:8d} {independent:15.1f} {pool['total_pss_mb']:9.1f} "
+              f"{independent / pool['total_pss_mb'] if pool['total_pss_mb'] else float('nan'):6.1f}x {private:18.1f}")
+        results["pools"][workers] = pool
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved {args.output}")
+
+if __name__ == "__main__":
+    main()
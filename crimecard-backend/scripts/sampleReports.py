@@ -0,0 +1,53 @@
+#crimecard-backend\scripts\sampleReports.py
+"""Shared helpers for the benchmark scripts: sample reports and service import."""
+import os
+import random
+import re
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_DIR = os.path.dirname(BACKEND_DIR)
+SERVICE_DIR = os.path.join(BACKEND_DIR, "app", "services")
+SAMPLE_FILES = ["test-samples.txt", "test1.txt", "test2.txt"]
+
+def load_service():
+    """Import nlpService.py as a module"""
+    if SERVICE_DIR not in sys.path:
+        sys.path.insert(0, SERVICE_DIR)
+    import nlpService
+    return nlpService
+
+def load_samples():
+    """Split the sample files into individual reports, dropping duplicates"""
+    reports = []
+    seen = set()
+    for name in SAMPLE_FILES:
+        with open(os.path.join(REPO_DIR, name), encoding="utf-8") as f:
+            raw = f.read()
+        for report in re.split(r"\n-{5,}\s*\n", raw):
+            report = report.strip()
+            # The same report appears in several files under a different "Sample N:" label
+            key = " ".join(re.sub(r"^Sample \d+:", "", report).split())
+            if report and key not in seen:
+                seen.add(key)
+                reports.append(report)
+    return reports
+
+def synthesize_corpus(reports, size, seed=0):
+    """A corpus of size distinct reports, each one to three sample reports joined together"""
+    rng = random.Random(seed)
+    corpus = []
+    for n in range(size):
+        parts = rng.sample(reports, min(len(reports), rng.randint(1, 3)))
+        corpus.append(f"Report {n + 1}.\n" + "\n\n".join(parts))
+    return corpus
+
+def long_document(reports, words, seed=0):
+    """One document of at least the given word count, built from shuffled sample reports"""
+    rng = random.Random(seed)
+    parts, count = [], 0
+    while count < words:
+        report = rng.choice(reports)
+        parts.append(report)
+        count += len(report.split())
+    return "\n\n".join(parts)